@@ -1,6 +1,8 @@
 """Boonta v2 CLI entry point."""
 from __future__ import annotations
 
+from pathlib import Path
+
 import click
 import pandas as pd
 
@@ -18,7 +20,13 @@ def cli():
 @click.option("--host", default="127.0.0.1", help="API host")
 @click.option("--no-vite", is_flag=True, help="Skip starting the vite dev server")
 @click.option("--reload/--no-reload", default=True, help="uvicorn --reload")
-def serve(port: int, host: str, no_vite: bool, reload: bool):
+@click.option(
+    "--loop",
+    type=click.Choice(["auto", "asyncio", "uvloop"]),
+    default="auto",
+    help="uvicorn event loop (auto = uvloop when installed, via uvicorn[standard])",
+)
+def serve(port: int, host: str, no_vite: bool, reload: bool, loop: str):
     """Start API server (and the vite dev server unless --no-vite)."""
     import shutil
     import subprocess
@@ -33,6 +41,7 @@ def serve(port: int, host: str, no_vite: bool, reload: bool):
     api_cmd = [
         "uvicorn", "src.api.main:app",
         "--host", host, "--port", str(port),
+        "--loop", loop,
     ]
     if reload:
         api_cmd.append("--reload")
@@ -181,7 +190,8 @@ def db_init():
     click.echo(f"DB ready: {db_path(settings)}")
 
 
-_INGEST_TYPES = ["KYI", "SED", "HJC", "BAC", "OW", "OU", "OT", "CYB", "KKA"]
+# JRDB file types accepted by download / parse / db ingest.
+_FILE_TYPES = ("KYI", "SED", "HJC", "BAC", "OW", "OU", "OT", "CYB", "KKA")
 
 
 def _ingest_one(session, file_type: str, date_str: str, settings) -> tuple[int, int, "date | None"]:
@@ -250,7 +260,7 @@ def _ingest_one(session, file_type: str, date_str: str, settings) -> tuple[int,
 
 
 @db.command("ingest")
-@click.option("--type", "file_type", required=True, type=click.Choice(_INGEST_TYPES))
+@click.option("--type", "file_type", required=True, type=click.Choice(_FILE_TYPES))
 @click.option("--date", "date_str", required=True, help="Date in YYMMDD format")
 def db_ingest(file_type: str, date_str: str):
     """Ingest a single day's parsed JRDB file into the DB."""
@@ -284,7 +294,7 @@ def db_ingest_all(date_str: str):
 
 
 @cli.command()
-@click.option("--type", "file_type", required=True, type=click.Choice(["KYI", "SED", "HJC", "BAC", "OW", "OU", "OT", "CYB", "KKA"]))
+@click.option("--type", "file_type", required=True, type=click.Choice(_FILE_TYPES))
 @click.option("--date", "date_str", help="Date in YYMMDD format (e.g. 260405)")
 @click.option(
     "--date-range", "date_range", nargs=2,
@@ -313,7 +323,7 @@ def download(file_type: str, date_str: str | None, date_range: tuple[str, str] |
 
 
 @cli.command()
-@click.option("--type", "file_type", type=click.Choice(["KYI", "SED", "HJC", "BAC", "OW", "OU", "OT", "CYB", "KKA"]))
+@click.option("--type", "file_type", type=click.Choice(_FILE_TYPES))
 @click.option("--date", "date_str", help="Date in YYMMDD format")
 @click.option("--all", "parse_all", is_flag=True, help="Parse all files in data/raw/")
 def parse(file_type: str | None, date_str: str | None, parse_all: bool):
@@ -367,16 +377,19 @@ def parse(file_type: str | None, date_str: str | None, parse_all: bool):
     help="autogluon = is_place binary, lambdarank = per-race ranker, both = train both",
 )
 @click.option("--lambdarank-rounds", default=3000, help="LightGBM num_boost_round")
+@click.option("--rebuild-features", is_flag=True,
+              help="Ignore the cached training features and rebuild from raw files")
 def train(
     date_range: tuple[str, str],
     time_limit: int,
     model_type: str,
     lambdarank_rounds: int,
+    rebuild_features: bool,
 ):
     """Train ML model from KYI + SED data."""
     from src.features.engineering import build_training_features
     from src.model.client import ModalClient
-    from src.parser import KYI_FIELDS, KYI_RECORD_LENGTH, SED_FIELDS, SED_RECORD_LENGTH
+    from src.parser import KYI_FIELDS, KYI_RECORD_LENGTH, SED_LABEL_FIELDS, SED_RECORD_LENGTH
     from src.parser.engine import parse_file
 
     settings = Settings()
@@ -384,7 +397,6 @@ def train(
     click.echo(f"Building training features from {date_range[0]} to {date_range[1]}...")
 
     # Parse KYI and SED files in the date range
-    kyi_frames, sed_frames = [], []
     kyi_paths = _filter_by_date_range(
         sorted(settings.data_raw_dir.glob("KYI*.txt")), date_range,
     )
@@ -392,27 +404,53 @@ def train(
         sorted(settings.data_raw_dir.glob("SED*.txt")), date_range,
     )
     click.echo(f"Found {len(kyi_paths)} KYI and {len(sed_paths)} SED files in range")
-    for path in kyi_paths:
-        kyi_frames.append(parse_file(path, KYI_FIELDS, KYI_RECORD_LENGTH))
-    for path in sed_paths:
-        sed_frames.append(parse_file(path, SED_FIELDS, SED_RECORD_LENGTH))
-
-    if not kyi_frames or not sed_frames:
+    if not kyi_paths or not sed_paths:
         click.echo("No KYI/SED files found in data/raw/")
         return
 
-    kyi_df = pd.concat(kyi_frames, ignore_index=True)
-    sed_df = pd.concat(sed_frames, ignore_index=True)
+    cache_path = _training_cache_path(settings, kyi_paths + sed_paths)
+    if cache_path.exists() and not rebuild_features:
+        click.echo(f"Using cached training features: {cache_path.name}")
+        training_df = pd.read_pickle(cache_path)
+    else:
+        # Features are per-horse / per-race, so build them one race day at a
+        # time and concatenate the (much narrower) daily feature frames from a
+        # generator; the raw 127-column KYI frames never coexist in memory.
+        sed_by_date = {p.stem[3:]: p for p in sed_paths}
+        day_pairs = [
+            (kyi_path, sed_by_date[kyi_path.stem[3:]])
+            for kyi_path in kyi_paths if kyi_path.stem[3:] in sed_by_date
+        ]
+        if not day_pairs:
+            click.echo("No dates with both KYI and SED files")
+            return
 
-    training_df = build_training_features(kyi_df, sed_df)
+        training_df = pd.concat(
+            (
+                build_training_features(
+                    parse_file(kyi_path, KYI_FIELDS, KYI_RECORD_LENGTH),
+                    # Only the join keys and result columns are used from SED.
+                    parse_file(sed_path, SED_LABEL_FIELDS, SED_RECORD_LENGTH),
+                )
+                for kyi_path, sed_path in day_pairs
+            ),
+            ignore_index=True,
+        )
+        _write_training_cache(cache_path, training_df)
     click.echo(f"Training data: {len(training_df)} samples, {len(training_df.columns)} features")
 
-    csv_data = training_df.to_csv(index=False)
-    client = ModalClient()
+    # Write once and stream the file onto the model volume; both trainers
+    # read it from there instead of receiving the CSV in the call payload.
+    settings.data_processed_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = settings.data_processed_dir / "training.csv"
+    training_df.to_csv(csv_path, index=False)
+    client = ModalClient(settings.modal_app_name, settings.modal_volume_name)
+    click.echo(f"Uploading {csv_path.name} to volume {settings.modal_volume_name}...")
+    training_data_path = client.upload_training_data(csv_path)
 
     if model_type in {"autogluon", "both"}:
         click.echo(f"Training AutoGluon (time_limit={time_limit}s)...")
-        result = client.train(csv_data, time_limit=time_limit)
+        result = client.train(time_limit=time_limit, training_data_path=training_data_path)
         if result.get("success"):
             click.echo(
                 f"AutoGluon done. Best AUC: {result.get('best_score')} "
@@ -428,8 +466,8 @@ def train(
     if model_type in {"lambdarank", "both"}:
         click.echo(f"Training LightGBM lambdarank (num_boost_round={lambdarank_rounds})...")
         rank_result = client.train_lambdarank(
-            csv_data,
             num_boost_round=lambdarank_rounds,
+            training_data_path=training_data_path,
         )
         if rank_result.get("success"):
             click.echo(
@@ -443,6 +481,37 @@ def train(
             click.echo(f"Lambdarank training failed: {rank_result.get('error')}")
 
 
+def _training_cache_path(settings: Settings, paths: list[Path]) -> Path:
+    """Cache file for built training features, keyed on inputs and feature code.
+
+    The key covers every raw file's name/size/mtime plus the parser and
+    feature-engineering sources and this module (train() pairs KYI/SED days
+    and picks the SED columns), so editing any of them invalidates the cache.
+    """
+    import hashlib
+
+    src_dir = settings.project_root / "src"
+    code_files = [
+        *sorted(src_dir.glob("features/*.py")),
+        *sorted(src_dir.glob("parser/*.py")),
+        Path(__file__).resolve(),
+    ]
+    h = hashlib.sha1()
+    for p in [*paths, *code_files]:
+        st = p.stat()
+        h.update(f"{p.name}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return settings.data_processed_dir / f"training_features_{h.hexdigest()[:16]}.pkl"
+
+
+def _write_training_cache(cache_path: Path, training_df: pd.DataFrame) -> None:
+    """Pickle the built features and drop caches left by earlier inputs or code."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    training_df.to_pickle(cache_path)
+    for stale in cache_path.parent.glob("training_features_*.pkl"):
+        if stale != cache_path:
+            stale.unlink()
+
+
 def _record_training_run(result: dict, time_limit: int) -> None:
     """Insert a TrainingRun row, mark prior DEPLOYED rows as archived."""
     import json
@@ -499,7 +568,9 @@ def _record_training_run(result: dict, time_limit: int) -> None:
                 train_time_seconds=result.get("train_time_seconds"),
                 num_samples=result.get("num_samples"),
                 status="DEPLOYED",
-                leaderboard_json=json.dumps(leaderboard) if leaderboard else None,
+                leaderboard_json=(
+                    json.dumps(leaderboard, separators=(",", ":")) if leaderboard else None
+                ),
                 created_at=datetime.now(timezone.utc).replace(tzinfo=None),
             )
         )
@@ -559,7 +630,7 @@ def evaluate(date_range: tuple[str, str], strategy: str, ev_threshold: float):
         KYI_FIELDS,
         KYI_RECORD_LENGTH,
     )
-    from src.parser.engine import build_race_key, parse_file
+    from src.parser.engine import build_race_keys, parse_file
     from src.predict.roi import evaluate_roi
 
     settings = Settings()
@@ -571,16 +642,17 @@ def evaluate(date_range: tuple[str, str], strategy: str, ev_threshold: float):
     kyi_paths = _filter_by_date_range(
         sorted(settings.data_raw_dir.glob("KYI*.txt")), date_range,
     )
-    kyi_frames = []
-    for path in kyi_paths:
-        kyi_frames.append(parse_file(path, KYI_FIELDS, KYI_RECORD_LENGTH))
-
-    if not kyi_frames:
+    if not kyi_paths:
         click.echo("No KYI files found")
         return
 
-    kyi_df = pd.concat(kyi_frames, ignore_index=True)
-    features_df = build_prediction_features(kyi_df)
+    features_df = pd.concat(
+        (
+            build_prediction_features(parse_file(path, KYI_FIELDS, KYI_RECORD_LENGTH))
+            for path in kyi_paths
+        ),
+        ignore_index=True,
+    )
 
     # Get predictions from Modal
     click.echo("Getting predictions from Modal...")
@@ -614,17 +686,15 @@ def evaluate(date_range: tuple[str, str], strategy: str, ev_threshold: float):
     hjc_paths = _filter_by_date_range(
         sorted(settings.data_raw_dir.glob("HJC*.txt")), date_range,
     )
-    hjc_frames = []
-    for path in hjc_paths:
-        df = parse_file(path, HJC_FIELDS, HJC_RECORD_LENGTH)
-        df["race_key"] = df.apply(lambda row: build_race_key(row.to_dict()), axis=1)
-        hjc_frames.append(df)
-
-    if not hjc_frames:
+    if not hjc_paths:
         click.echo("No HJC files found")
         return
 
-    hjc_df = pd.concat(hjc_frames, ignore_index=True)
+    hjc_df = pd.concat(
+        (parse_file(path, HJC_FIELDS, HJC_RECORD_LENGTH) for path in hjc_paths),
+        ignore_index=True,
+    )
+    hjc_df["race_key"] = build_race_keys(hjc_df)
 
     # Evaluate ROI
     result = evaluate_roi(predictions_df, hjc_df, strategy, ev_threshold=ev_threshold)
@@ -685,20 +755,31 @@ def _parse_files(settings: Settings, fields: list, rec_len: int, prefix: str, ft
         click.echo(f"No {ft} files found")
         return
 
-    all_frames = []
-    for path in paths:
-        try:
-            df = parse_file(path, fields, rec_len)
-            all_frames.append(df)
+    # Append each file to the combined CSV as it is parsed so only one day's
+    # frame is held in memory; the header is written with the first non-empty
+    # chunk. Rows go to a temp file that replaces the previous CSV only once
+    # something parsed, so a run where every file fails keeps the old output.
+    out = settings.data_processed_dir / f"{prefix.lower()}.csv"
+    tmp = out.with_suffix(".csv.tmp")
+    total = 0
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        for path in paths:
+            try:
+                df = parse_file(path, fields, rec_len)
+            except Exception as e:
+                click.echo(f"  Error parsing {path.name}: {e}", err=True)
+                continue
             click.echo(f"  Parsed {path.name}: {len(df)} records")
-        except Exception as e:
-            click.echo(f"  Error parsing {path.name}: {e}", err=True)
+            if df.empty:
+                continue
+            df.to_csv(f, index=False, header=total == 0)
+            total += len(df)
 
-    if all_frames:
-        combined = pd.concat(all_frames, ignore_index=True)
-        out = settings.data_processed_dir / f"{prefix.lower()}.csv"
-        combined.to_csv(out, index=False)
-        click.echo(f"  Combined → {out} ({len(combined)} total records)")
+    if total:
+        tmp.replace(out)
+        click.echo(f"  Combined → {out} ({total} total records)")
+    else:
+        tmp.unlink()
 
 
 @cli.command()
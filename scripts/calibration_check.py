@@ -33,10 +33,10 @@ from src.model.client import ModalClient  # noqa: E402
 from src.parser import (  # noqa: E402
     KYI_FIELDS,
     KYI_RECORD_LENGTH,
-    SED_FIELDS,
+    SED_LABEL_FIELDS,
     SED_RECORD_LENGTH,
 )
-from src.parser.engine import build_race_key, parse_file  # noqa: E402
+from src.parser.engine import build_race_keys, parse_file  # noqa: E402
 
 
 def _load_kyi(settings: Settings, yy: str) -> pd.DataFrame:
@@ -57,10 +57,10 @@ def _load_sed_labels(settings: Settings, yy: str) -> pd.DataFrame:
         raise SystemExit(f"No SED files for year {yy}")
     print(f"Loading {len(paths)} SED files...")
     sed = pd.concat(
-        [parse_file(p, SED_FIELDS, SED_RECORD_LENGTH) for p in paths],
+        [parse_file(p, SED_LABEL_FIELDS, SED_RECORD_LENGTH) for p in paths],
         ignore_index=True,
     )
-    sed["race_key"] = sed.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+    sed["race_key"] = build_race_keys(sed)
     sed["horse_number"] = pd.to_numeric(sed["馬番"], errors="coerce").astype("Int64")
 
     # Filter anomalies (取消, 失格 etc.). 異常区分: 0=normal or NaN
@@ -33,7 +33,7 @@ from src.parser import (  # noqa: E402
     KYI_FIELDS,
     KYI_RECORD_LENGTH,
 )
-from src.parser.engine import build_race_key, parse_file  # noqa: E402
+from src.parser.engine import build_race_keys, parse_file  # noqa: E402
 from src.predict.roi import evaluate_roi  # noqa: E402
 
 EV_STRATEGIES = ["ev_tansho", "ev_fukusho", "ev_sanrenpuku_nagashi"]
@@ -81,7 +81,7 @@ def _load_hjc(settings: Settings, date_range: tuple[str, str]) -> pd.DataFrame:
     frames = []
     for p in paths:
         df = parse_file(p, HJC_FIELDS, HJC_RECORD_LENGTH)
-        df["race_key"] = df.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+        df["race_key"] = build_race_keys(df)
         frames.append(df)
     return pd.concat(frames, ignore_index=True)
 
@@ -204,6 +204,12 @@ def get_feature_importance() -> list[FeatureImportanceRow]:
 
 _CALIBRATION_CACHE: dict[str, tuple[float, CalibrationResponse]] = {}
 _CALIBRATION_TTL = 600.0
+_CALIBRATION_BINS = 10
+
+
+def _calibration_bin(prob: float) -> int:
+    """Decile bin for a probability, clamped so 1.0 (and stray values) stay in range."""
+    return min(_CALIBRATION_BINS - 1, max(0, int(prob * _CALIBRATION_BINS)))
 
 
 @router.get("/calibration", response_model=CalibrationResponse)
@@ -237,12 +243,13 @@ def get_calibration(
         {"window_from": window_from},
     ).all()
 
-    bins_acc = [{"sum_pred": 0.0, "sum_actual": 0, "n": 0} for _ in range(10)]
+    bins_acc = [{"sum_pred": 0.0, "sum_actual": 0, "n": 0} for _ in range(_CALIBRATION_BINS)]
     n_total = 0
     window_to: Optional[datetime] = None
     for prob, is_place in rows:
-        idx = min(9, max(0, int(float(prob) * 10)))
-        bins_acc[idx]["sum_pred"] += float(prob)
+        prob = float(prob)
+        idx = _calibration_bin(prob)
+        bins_acc[idx]["sum_pred"] += prob
         bins_acc[idx]["sum_actual"] += int(is_place)
         bins_acc[idx]["n"] += 1
         n_total += 1
@@ -1,6 +1,7 @@
 """Prediction endpoints — calls Modal sync, upserts predictions, returns Horse[]."""
 from __future__ import annotations
 
+import numbers
 import time
 from datetime import date, datetime
 from typing import Optional
@@ -11,17 +12,26 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
+from config.settings import Settings
 from src.api.deps import DbSession
-from src.api.routers.races import _horse_to_schema
+from src.api.routers.races import _RACE_WITH_PREDICTIONS, _horse_to_schema
 from src.api.schemas import (
     PredictBatchItem,
     PredictBatchResponse,
     PredictResponse,
 )
-from src.db.models import HorseEntry, Prediction, Race
+from src.db.models import HorseEntry, Prediction, Race, RaceOdds
 from src.features.engineering import build_prediction_features
 from src.parser import KYI_FIELDS, KYI_RECORD_LENGTH
 from src.parser.engine import parse_file
+from src.predict.multibet import (
+    compute_fuku_ev,
+    compute_sanrenpuku_ev,
+    compute_tan_ev,
+    compute_umatan_ev,
+    compute_wide_ev,
+    recommend_threshold,
+)
 
 router = APIRouter(prefix="/races", tags=["predict"])
 
@@ -47,8 +57,6 @@ def _resolve_model_version() -> str:
 
 def _kyi_path_for(held_on: date) -> "tuple[Optional[object], str]":
     """Locate the raw KYI file for a given held_on date."""
-    from config.settings import Settings
-
     settings = Settings()
     yymmdd = held_on.strftime("%y%m%d")
     path = settings.data_raw_dir / f"KYI{yymmdd}.txt"
@@ -57,20 +65,44 @@ def _kyi_path_for(held_on: date) -> "tuple[Optional[object], str]":
     return path, ""
 
 
-def _predict_one(session: Session, race: Race, model_version: str) -> tuple[int, str]:
+def _opt_float(val: object) -> float | None:
+    # numbers.Real also admits numpy scalars (float32 after downcasting).
+    if not isinstance(val, (numbers.Real, str)) or pd.isna(val):
+        return None
+    return float(val)
+
+
+def _load_features(held_on: date) -> "tuple[Optional[pd.DataFrame], str]":
+    """Parse the day's KYI file and build prediction features for every race."""
+    path, err = _kyi_path_for(held_on)
+    if path is None:
+        return None, err
+    kyi_df = parse_file(path, KYI_FIELDS, KYI_RECORD_LENGTH)
+    return build_prediction_features(kyi_df), ""
+
+
+def _predict_one(
+    session: Session,
+    race: Race,
+    model_version: str,
+    feats: Optional[pd.DataFrame] = None,
+) -> tuple[int, str]:
     """Run prediction for one race; upsert prediction rows. Returns (count, error).
 
+    ``feats`` is the day's feature frame from :func:`_load_features`; callers
+    predicting several races of the same day pass it in so the KYI file is
+    parsed once instead of once per race.
+
     Phase 2 extension: also call the lambdarank model (if deployed) to populate
     ``prob_win``/``prob_top2``/``prob_top3``/``lambdarank_score``.
     """
     from src.model.client import ModalClient
 
-    path, err = _kyi_path_for(race.held_on)
-    if path is None:
-        return 0, err
+    if feats is None:
+        feats, err = _load_features(race.held_on)
+        if feats is None:
+            return 0, err
 
-    kyi_df = parse_file(path, KYI_FIELDS, KYI_RECORD_LENGTH)
-    feats = build_prediction_features(kyi_df)
     race_feats = feats[feats["race_key"] == race.race_key].copy()
     if race_feats.empty:
         return 0, f"No KYI rows for race_key={race.race_key}"
@@ -109,57 +141,47 @@ def _predict_one(session: Session, race: Race, model_version: str) -> tuple[int,
 
     now = datetime.utcnow()
     horses_by_no = {h.horse_number: h for h in race.horses}
+    # One query for this race's existing rows instead of one per horse.
+    existing = {
+        p.horse_entry_id: p
+        for p in session.scalars(
+            select(Prediction)
+            .join(HorseEntry)
+            .where(
+                HorseEntry.race_id == race.id,
+                Prediction.model_version == model_version,
+            )
+        )
+    }
 
+    new_preds: list[Prediction] = []
     written = 0
-    for _, row in race_feats.iterrows():
-        hn = int(row["horse_number"])
-        horse = horses_by_no.get(hn)
+    for row in race_feats.to_dict("records"):
+        horse = horses_by_no.get(int(row["horse_number"]))
         if horse is None:
             continue
 
-        def _opt(col: str) -> float | None:
-            val = row.get(col)
-            if val is None or (isinstance(val, float) and pd.isna(val)):
-                return None
-            return float(val)
-
-        pred = session.scalar(
-            select(Prediction).where(
-                Prediction.horse_entry_id == horse.id,
-                Prediction.model_version == model_version,
-            )
-        )
-        kwargs = {
-            "prob": float(row["prob"]),
-            "ev_tan": _opt("ev_tan"),
-            "ev_fuku": _opt("ev_fuku"),
-            "prob_win": _opt("prob_win"),
-            "prob_top2": _opt("prob_top2"),
-            "prob_top3": _opt("prob_top3"),
-            "lambdarank_score": _opt("lambdarank_score"),
-            "predicted_at": now,
-        }
+        pred = existing.get(horse.id)
         if pred is None:
-            session.add(Prediction(
-                horse_entry_id=horse.id,
-                model_version=model_version,
-                **kwargs,
-            ))
-        else:
-            for k, v in kwargs.items():
-                setattr(pred, k, v)
+            pred = Prediction(horse_entry_id=horse.id, model_version=model_version)
+            new_preds.append(pred)
+        pred.prob = float(row["prob"])
+        pred.ev_tan = _opt_float(row.get("ev_tan"))
+        pred.ev_fuku = _opt_float(row.get("ev_fuku"))
+        pred.prob_win = _opt_float(row.get("prob_win"))
+        pred.prob_top2 = _opt_float(row.get("prob_top2"))
+        pred.prob_top3 = _opt_float(row.get("prob_top3"))
+        pred.lambdarank_score = _opt_float(row.get("lambdarank_score"))
+        pred.predicted_at = now
         written += 1
 
+    session.add_all(new_preds)
     return written, ""
 
 
 @router.post("/{race_key}/predict", response_model=PredictResponse)
 def predict_race(race_key: str, session: DbSession) -> PredictResponse:
-    race = session.scalar(
-        select(Race)
-        .where(Race.race_key == race_key)
-        .options(selectinload(Race.horses).selectinload(HorseEntry.predictions))
-    )
+    race = session.scalar(_RACE_WITH_PREDICTIONS, {"race_key": race_key})
     if race is None:
         raise HTTPException(status_code=404, detail=f"Race not found: {race_key}")
 
@@ -171,7 +193,13 @@ def predict_race(race_key: str, session: DbSession) -> PredictResponse:
     if written == 0:
         raise HTTPException(status_code=500, detail="No predictions written")
     session.commit()
-    session.refresh(race)
+    # Re-run the eager load over the identity map (3 queries) rather than
+    # refresh(race), whose cascade re-selects every horse and prediction.
+    race = session.execute(
+        _RACE_WITH_PREDICTIONS,
+        {"race_key": race_key},
+        execution_options={"populate_existing": True},
+    ).scalar_one()
     elapsed_ms = int((time.perf_counter() - started) * 1000)
 
     latest_by_horse = {
@@ -240,21 +268,7 @@ def race_multibet(
     Reads pre-race odds (from race_odds, ingested via OW/OU/OT) and the
     latest predictions (prob_win from lambdarank if available; falls back to
     prob/3 from AutoGluon)."""
-    from src.db.models import HorseEntry, RaceOdds
-    from src.predict.multibet import (
-        compute_fuku_ev,
-        compute_sanrenpuku_ev,
-        compute_tan_ev,
-        compute_umatan_ev,
-        compute_wide_ev,
-        recommend_threshold,
-    )
-
-    race = session.scalar(
-        select(Race)
-        .where(Race.race_key == race_key)
-        .options(selectinload(Race.horses).selectinload(HorseEntry.predictions))
-    )
+    race = session.scalar(_RACE_WITH_PREDICTIONS, {"race_key": race_key})
     if race is None:
         raise HTTPException(status_code=404, detail=f"Race not found: {race_key}")
 
@@ -326,9 +340,22 @@ def predict_batch(req: PredictBatchRequest, session: DbSession) -> PredictBatchR
     started = time.perf_counter()
     jobs: list[PredictBatchItem] = []
 
+    # A malformed KYI file fails every race of the day alike; report it per race.
+    try:
+        feats, feats_err = _load_features(req.date)
+    except Exception as e:
+        feats, feats_err = None, str(e)
+    if feats is None:
+        jobs = [
+            PredictBatchItem(race_key=race.race_key, status="error", error=feats_err)
+            for race in races
+        ]
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return PredictBatchResponse(jobs=jobs, elapsed_ms=elapsed_ms)
+
     for race in races:
         try:
-            written, err = _predict_one(session, race, model_version)
+            written, err = _predict_one(session, race, model_version, feats)
             if err:
                 jobs.append(PredictBatchItem(race_key=race.race_key, status="error", error=err))
             elif written == 0:
@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import date
 
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import selectinload
 
 from src.api import labels
@@ -14,6 +14,14 @@ from src.db.models import HorseEntry, Prediction, Race
 
 router = APIRouter(prefix="/races", tags=["races"])
 
+# Race by :race_key with horses and their predictions eager-loaded. Built once
+# at import; callers pass {"race_key": ...} instead of rebuilding the select.
+_RACE_WITH_PREDICTIONS = (
+    select(Race)
+    .where(Race.race_key == bindparam("race_key"))
+    .options(selectinload(Race.horses).selectinload(HorseEntry.predictions))
+)
+
 
 def _horse_to_schema(h: HorseEntry, pred: Prediction | None) -> Horse:
     return Horse(
@@ -118,11 +126,7 @@ def list_races(
 
 @router.get("/{race_key}", response_model=RaceDetail)
 def get_race(race_key: str, session: DbSession) -> RaceDetail:
-    race = session.scalar(
-        select(Race)
-        .where(Race.race_key == race_key)
-        .options(selectinload(Race.horses).selectinload(HorseEntry.predictions))
-    )
+    race = session.scalar(_RACE_WITH_PREDICTIONS, {"race_key": race_key})
     if race is None:
         raise HTTPException(status_code=404, detail=f"Race not found: {race_key}")
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 from fastapi import APIRouter
 from sqlalchemy import func, select
 
+from config.settings import Settings
 from src.api.deps import DbSession
 from src.api.schemas import SystemStatus
 from src.db.models import Race
@@ -32,8 +33,6 @@ def get_status(session: DbSession) -> SystemStatus:
     except Exception:
         modal_ready = False
 
-    from config.settings import Settings
-
     s = Settings()
     return SystemStatus(
         jrdb_sync=last_sync,
@@ -6,10 +6,10 @@ Pipeline: DB rows → DataFrame → evaluate_roi (existing logic) → BacktestRu
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 import pandas as pd
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 
 from src.db.models import (
@@ -24,7 +24,7 @@ from src.db.models import (
 )
 from src.predict.roi import evaluate_roi
 
-STRATEGIES: list[str] = [
+STRATEGIES: tuple[str, ...] = (
     "fukusho_top3",
     "umaren_top2",
     "sanrenpuku_top3",
@@ -35,22 +35,23 @@ STRATEGIES: list[str] = [
     "ev_wide",
     "ev_umatan",
     "ev_sanrenpuku_box",
-]
+)
 
-EV_STRATEGIES: set[str] = {
+EV_STRATEGIES: frozenset[str] = frozenset({
     "ev_tansho",
     "ev_fukusho",
     "ev_sanrenpuku_nagashi",
     "ev_wide",
     "ev_umatan",
     "ev_sanrenpuku_box",
-}
+})
 
 # Strategies that require pre-race combination odds (race_odds_df)
-MULTIBET_STRATEGIES: set[str] = {"ev_wide", "ev_umatan", "ev_sanrenpuku_box"}
+MULTIBET_STRATEGIES: frozenset[str] = frozenset({"ev_wide", "ev_umatan", "ev_sanrenpuku_box"})
 
 # Sensitivity sweep: 0.80 → 1.50 step 0.05 (matches TweaksPanel slider).
-SENSITIVITY_THRESHOLDS: list[float] = [round(0.80 + 0.05 * i, 2) for i in range(15)]
+# Tuple: it is the default argument of run_sensitivity_sweep, so keep it immutable.
+SENSITIVITY_THRESHOLDS: tuple[float, ...] = tuple(round(0.80 + 0.05 * i, 2) for i in range(15))
 
 
 # ─────────── DB → DataFrame ───────────
@@ -201,8 +202,10 @@ def _persist_run(
     held_on_lookup: dict[str, date],
 ) -> BacktestRun:
     """Replace any existing run with same key, then write new run + details."""
-    existing = session.scalar(
-        select(BacktestRun).where(
+    # One DELETE; detail/sensitivity rows go with it via ON DELETE CASCADE
+    # instead of the ORM loading and deleting each child row.
+    session.execute(
+        delete(BacktestRun).where(
             BacktestRun.strategy == strategy,
             BacktestRun.date_from == date_from,
             BacktestRun.date_to == date_to,
@@ -210,9 +213,6 @@ def _persist_run(
             BacktestRun.model_version == model_version,
         )
     )
-    if existing is not None:
-        session.delete(existing)
-        session.flush()
 
     run = BacktestRun(
         strategy=strategy,
@@ -236,20 +236,25 @@ def _persist_run(
         select(Race.race_key, Race.id).where(Race.race_key.in_(held_on_lookup.keys()))
     ).all())
 
+    # Details are write-only here (the API re-reads them with selectinload), so
+    # skip ORM objects and send one executemany INSERT.
+    details: list[dict] = []
     for d in result.get("details", []):
         race_key = d.get("race_key")
         race_id = race_id_map.get(race_key)
         held = held_on_lookup.get(race_key)
         if race_id is None or held is None:
             continue
-        session.add(BacktestDetail(
-            run_id=run.id,
-            race_id=race_id,
-            held_on=held,
-            bets=int(d.get("bets") or 0),
-            return_amount=int(d.get("return") or 0),
-            hit=1 if d.get("hit") else 0,
-        ))
+        details.append({
+            "run_id": run.id,
+            "race_id": race_id,
+            "held_on": held,
+            "bets": int(d.get("bets") or 0),
+            "return_amount": int(d.get("return") or 0),
+            "hit": 1 if d.get("hit") else 0,
+        })
+    if details:
+        session.execute(insert(BacktestDetail), details)
     return run
 
 
@@ -316,7 +321,7 @@ def run_sensitivity_sweep(
     run: BacktestRun,
     preds_df: pd.DataFrame,
     hjc_df: pd.DataFrame,
-    thresholds: list[float] = SENSITIVITY_THRESHOLDS,
+    thresholds: Sequence[float] = SENSITIVITY_THRESHOLDS,
 ) -> int:
     """Sweep ev_threshold for the run's strategy, store under backtest_sensitivity."""
     if run.strategy not in EV_STRATEGIES:
@@ -330,7 +335,7 @@ def run_sensitivity_sweep(
     if run.strategy in MULTIBET_STRATEGIES:
         race_odds_df = load_race_odds_df(session, run.date_from, run.date_to)
 
-    written = 0
+    rows: list[BacktestSensitivity] = []
     for thr in thresholds:
         res = evaluate_roi(
             preds_df,
@@ -339,12 +344,12 @@ def run_sensitivity_sweep(
             ev_threshold=thr,
             race_odds_df=race_odds_df,
         )
-        session.add(BacktestSensitivity(
+        rows.append(BacktestSensitivity(
             run_id=run.id,
             ev_threshold=thr,
             bet_races=res.get("bet_race_count"),
             hits=res.get("hit_count"),
             roi=res.get("roi"),
         ))
-        written += 1
-    return written
+    session.add_all(rows)
+    return len(rows)
@@ -9,7 +9,7 @@ from src.db.models import (
     Prediction,
     Race,
 )
-from src.db.session import db_path, engine, get_engine, get_session, session_scope
+from src.db.session import db_path, get_engine, get_session, session_scope
 
 __all__ = [
     "Base",
@@ -20,9 +20,15 @@ __all__ = [
     "BacktestRun",
     "BacktestDetail",
     "BacktestSensitivity",
-    "engine",
     "get_engine",
     "get_session",
     "session_scope",
     "db_path",
 ]
+
+
+def __getattr__(name: str):
+    # ``engine`` is created lazily; see src.db.session.get_engine.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import math
+import re
 from datetime import date, datetime
 from pathlib import Path
 
 import pandas as pd
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.db.models import (
     CybRecord,
@@ -17,7 +18,7 @@ from src.db.models import (
     Race,
     RaceOdds,
 )
-from src.parser.engine import build_race_key
+from src.parser.engine import build_race_keys
 
 
 def _merge_source(existing: str | None, new: str) -> str:
@@ -30,6 +31,9 @@ VENUE_NAMES: dict[str, str] = {
     "06": "中山", "07": "中京", "08": "京都", "09": "阪神", "10": "小倉",
 }
 
+# Well-formed 8-digit race_key: venue 01-10, year/kai/nichi, race_no 01-12.
+_RACE_KEY_RE = re.compile(r"(?:0[1-9]|10)\d{4}(?:0[1-9]|1[0-2])")
+
 
 def held_on_from_filename(path: Path) -> date:
     """Decode held_on date from KYI/SED/HJC filename like KYI200405.txt → 2020-04-05.
@@ -86,15 +90,43 @@ def _mode(series: pd.Series) -> str | None:
     return cleaned.mode().iloc[0]
 
 
+def _races_by_key(session: Session, race_keys, *options) -> dict[str, Race]:
+    """Existing races for ``race_keys`` in one IN query, keyed by race_key.
+
+    ``options`` are loader options (e.g. ``selectinload(Race.horses)``) so the
+    caller's per-race relationship access doesn't lazy-load one race at a time.
+    """
+    keys = [str(k) for k in dict.fromkeys(race_keys) if k]
+    if not keys:
+        return {}
+    stmt = select(Race).where(Race.race_key.in_(keys)).options(*options)
+    return {r.race_key: r for r in session.scalars(stmt)}
+
+
+def _entries_by_key(session: Session, race_keys) -> dict[tuple[str, int], HorseEntry]:
+    """Existing horse entries for ``race_keys`` in one query, keyed by (race_key, 馬番)."""
+    keys = [str(k) for k in dict.fromkeys(race_keys) if k]
+    if not keys:
+        return {}
+    rows = session.execute(
+        select(Race.race_key, HorseEntry)
+        .join(HorseEntry.race)
+        .where(Race.race_key.in_(keys))
+    )
+    return {(race_key, entry.horse_number): entry for race_key, entry in rows}
+
+
 def ingest_kyi(session: Session, df: pd.DataFrame, held_on: date) -> int:
     """Upsert KYI DataFrame into race + horse_entry. Returns # races touched."""
     if df.empty:
         return 0
 
     df = df.copy()
-    df["race_key"] = df.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+    df["race_key"] = build_race_keys(df)
     now = datetime.utcnow()
     races_touched = 0
+    new_entries: list[HorseEntry] = []
+    races = _races_by_key(session, df["race_key"], selectinload(Race.horses))
 
     for race_key, group in df.groupby("race_key"):
         first = group.iloc[0]
@@ -103,7 +135,7 @@ def ingest_kyi(session: Session, df: pd.DataFrame, held_on: date) -> int:
         head_count = len(group)
         pace = _mode(group.get("ペース予想", pd.Series(dtype=str)))
 
-        race = session.scalar(select(Race).where(Race.race_key == race_key))
+        race = races.get(race_key)
         if race is None:
             race = Race(
                 race_key=str(race_key),
@@ -117,7 +149,6 @@ def ingest_kyi(session: Session, df: pd.DataFrame, held_on: date) -> int:
                 ingested_at=now,
             )
             session.add(race)
-            session.flush()  # populate race.id
         else:
             race.held_on = held_on
             race.venue_code = venue_code
@@ -163,12 +194,15 @@ def ingest_kyi(session: Session, df: pd.DataFrame, held_on: date) -> int:
 
             entry = existing.get(horse_number)
             if entry is None:
-                entry = HorseEntry(race_id=race.id, **data)
-                session.add(entry)
+                # Linked through the relationship: new races have no id until the flush below.
+                new_entries.append(HorseEntry(race=race, **data))
             else:
                 for k, v in data.items():
                     setattr(entry, k, v)
 
+    session.add_all(new_entries)
+    # One flush for the whole file: races and entries go out as batched INSERTs.
+    session.flush()
     return races_touched
 
 
@@ -182,12 +216,13 @@ def ingest_sed(session: Session, df: pd.DataFrame, held_on: date) -> int:
         return 0
 
     df = df.copy()
-    df["race_key"] = df.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+    df["race_key"] = build_race_keys(df)
     now = datetime.utcnow()
     touched = 0
+    races = _races_by_key(session, df["race_key"])
 
     for race_key, group in df.groupby("race_key"):
-        race = session.scalar(select(Race).where(Race.race_key == race_key))
+        race = races.get(race_key)
         if race is None:
             # No KYI row yet — skip; we don't want a SED-only ghost race here.
             continue
@@ -231,27 +266,20 @@ def ingest_bac(session: Session, df: pd.DataFrame, held_on: date) -> int:
         return 0
 
     df = df.copy()
-    df["race_key"] = df.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+    df["race_key"] = build_race_keys(df)
 
     # Drop malformed race_keys (e.g. from a prior run with wrong record length).
-    # Valid keys: venue 01-10, race_no 01-12.
-    def _valid(k: str) -> bool:
-        if not isinstance(k, str) or len(k) != 8 or not k.isdigit():
-            return False
-        venue = int(k[:2])
-        race_no = int(k[6:8])
-        return 1 <= venue <= 10 and 1 <= race_no <= 12
-
-    df = df[df["race_key"].map(_valid)].copy()
+    df = df[df["race_key"].str.fullmatch(_RACE_KEY_RE).fillna(False)].copy()
     if df.empty:
         return 0
 
     now = datetime.utcnow()
     touched = 0
+    races = _races_by_key(session, df["race_key"])
 
     for race_key, group in df.groupby("race_key"):
         first = group.iloc[0]
-        race = session.scalar(select(Race).where(Race.race_key == race_key))
+        race = races.get(race_key)
         if race is None:
             venue_code = f"{_to_int(first.get('場コード')) or 0:02d}"
             race = Race(
@@ -264,7 +292,6 @@ def ingest_bac(session: Session, df: pd.DataFrame, held_on: date) -> int:
                 ingested_at=now,
             )
             session.add(race)
-            session.flush()
 
         race.distance = _to_int(first.get("距離")) or race.distance
         race.surface = _to_str(first.get("芝ダ障害コード")) or race.surface
@@ -288,6 +315,7 @@ def ingest_bac(session: Session, df: pd.DataFrame, held_on: date) -> int:
         race.ingested_at = now
         touched += 1
 
+    session.flush()  # new races in one batched INSERT
     return touched
 
 
@@ -306,12 +334,19 @@ def ingest_race_odds(
 
     now = datetime.utcnow()
     touched = 0
+    races = _races_by_key(session, df["race_key"])
+    odds_rows = {
+        o.race_id: o
+        for o in session.scalars(
+            select(RaceOdds).where(RaceOdds.race_id.in_([r.id for r in races.values()]))
+        )
+    }
 
     for _, row in df.iterrows():
         race_key = row.get("race_key")
         if not race_key:
             continue
-        race = session.scalar(select(Race).where(Race.race_key == race_key))
+        race = races.get(race_key)
         if race is None:
             # Race must exist (BAC/KYI ingested first); skip orphans
             continue
@@ -320,26 +355,16 @@ def ingest_race_odds(
         # Drop None values to keep JSON compact
         clean = {k: v for k, v in odds_dict.items() if v is not None}
 
-        existing = session.scalar(
-            select(RaceOdds).where(RaceOdds.race_id == race.id)
-        )
+        odds_row = odds_rows.get(race.id)
         head_count = _to_int(row.get("head_count"))
-        if existing is None:
-            kwargs = {
-                "race_id": race.id,
-                "head_count": head_count,
-                "ingested_at": now,
-                "wide": None,
-                "umatan": None,
-                "sanrenpuku": None,
-            }
-            kwargs[bet_type] = clean or None
-            session.add(RaceOdds(**kwargs))
-        else:
-            setattr(existing, bet_type, clean or None)
-            if head_count is not None:
-                existing.head_count = head_count
-            existing.ingested_at = now
+        if odds_row is None:
+            odds_row = RaceOdds(race_id=race.id, head_count=head_count)
+            session.add(odds_row)
+            odds_rows[race.id] = odds_row
+        elif head_count is not None:
+            odds_row.head_count = head_count
+        setattr(odds_row, bet_type, clean or None)
+        odds_row.ingested_at = now
         touched += 1
 
     return touched
@@ -350,24 +375,25 @@ def ingest_cyb(session: Session, df: pd.DataFrame, held_on: date) -> int:
     if df.empty:
         return 0
     df = df.copy()
-    df["race_key"] = df.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+    df["race_key"] = build_race_keys(df)
     now = datetime.utcnow()
     touched = 0
+    entries = _entries_by_key(session, df["race_key"])
+    records = {
+        r.horse_entry_id: r
+        for r in session.scalars(
+            select(CybRecord).where(
+                CybRecord.horse_entry_id.in_([e.id for e in entries.values()])
+            )
+        )
+    }
 
     for _, row in df.iterrows():
         race_key = row["race_key"]
         umaban = _to_int(row.get("馬番"))
         if not race_key or umaban is None:
             continue
-        race = session.scalar(select(Race).where(Race.race_key == race_key))
-        if race is None:
-            continue
-        horse = session.scalar(
-            select(HorseEntry).where(
-                HorseEntry.race_id == race.id,
-                HorseEntry.horse_number == umaban,
-            )
-        )
+        horse = entries.get((race_key, umaban))
         if horse is None:
             continue
 
@@ -382,18 +408,17 @@ def ingest_cyb(session: Session, df: pd.DataFrame, held_on: date) -> int:
             else:
                 raw_dict[col] = str(val)
 
-        existing = session.scalar(
-            select(CybRecord).where(CybRecord.horse_entry_id == horse.id)
-        )
+        existing = records.get(horse.id)
         if existing is None:
-            session.add(CybRecord(
+            records[horse.id] = CybRecord(
                 horse_entry_id=horse.id,
                 finish_index=_to_int(row.get("仕上指数")),
                 chase_index=_to_int(row.get("追切指数")),
                 training_eval=_to_str(row.get("調教評価")),
                 raw=raw_dict,
                 ingested_at=now,
-            ))
+            )
+            session.add(records[horse.id])
         else:
             existing.finish_index = _to_int(row.get("仕上指数"))
             existing.chase_index = _to_int(row.get("追切指数"))
@@ -410,24 +435,25 @@ def ingest_kka(session: Session, df: pd.DataFrame, held_on: date) -> int:
     if df.empty:
         return 0
     df = df.copy()
-    df["race_key"] = df.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+    df["race_key"] = build_race_keys(df)
     now = datetime.utcnow()
     touched = 0
+    entries = _entries_by_key(session, df["race_key"])
+    records = {
+        r.horse_entry_id: r
+        for r in session.scalars(
+            select(KkaRecord).where(
+                KkaRecord.horse_entry_id.in_([e.id for e in entries.values()])
+            )
+        )
+    }
 
     for _, row in df.iterrows():
         race_key = row["race_key"]
         umaban = _to_int(row.get("馬番"))
         if not race_key or umaban is None:
             continue
-        race = session.scalar(select(Race).where(Race.race_key == race_key))
-        if race is None:
-            continue
-        horse = session.scalar(
-            select(HorseEntry).where(
-                HorseEntry.race_id == race.id,
-                HorseEntry.horse_number == umaban,
-            )
-        )
+        horse = entries.get((race_key, umaban))
         if horse is None:
             continue
 
@@ -442,15 +468,14 @@ def ingest_kka(session: Session, df: pd.DataFrame, held_on: date) -> int:
             else:
                 raw_dict[col] = str(val)
 
-        existing = session.scalar(
-            select(KkaRecord).where(KkaRecord.horse_entry_id == horse.id)
-        )
+        existing = records.get(horse.id)
         if existing is None:
-            session.add(KkaRecord(
+            records[horse.id] = KkaRecord(
                 horse_entry_id=horse.id,
                 raw=raw_dict,
                 ingested_at=now,
-            ))
+            )
+            session.add(records[horse.id])
         else:
             existing.raw = raw_dict
             existing.ingested_at = now
@@ -465,12 +490,13 @@ def ingest_hjc(session: Session, df: pd.DataFrame, held_on: date) -> int:
         return 0
 
     df = df.copy()
-    df["race_key"] = df.apply(lambda r: build_race_key(r.to_dict()), axis=1)
+    df["race_key"] = build_race_keys(df)
     now = datetime.utcnow()
     touched = 0
+    races = _races_by_key(session, df["race_key"], selectinload(Race.payout))
 
     for race_key, group in df.groupby("race_key"):
-        race = session.scalar(select(Race).where(Race.race_key == race_key))
+        race = races.get(race_key)
         if race is None:
             # Defer: HJC without prior KYI — skip silently
             continue
@@ -489,11 +515,9 @@ def ingest_hjc(session: Session, df: pd.DataFrame, held_on: date) -> int:
             else:
                 raw_dict[col] = str(val)
 
-        payout = session.scalar(
-            select(HjcPayout).where(HjcPayout.race_id == race.id)
-        )
+        payout = race.payout
         if payout is None:
-            session.add(HjcPayout(race_id=race.id, raw=raw_dict, ingested_at=now))
+            race.payout = HjcPayout(race_id=race.id, raw=raw_dict, ingested_at=now)
         else:
             payout.raw = raw_dict
             payout.ingested_at = now
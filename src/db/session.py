@@ -5,6 +5,7 @@ while the backtest CLI writes.
 """
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
@@ -41,16 +42,39 @@ def _make_engine(settings: Settings | None = None) -> Engine:
     return eng
 
 
-engine: Engine = _make_engine()
-SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+# Bound on first use, so importing src.db (e.g. for the models in tests)
+# neither creates data/ nor opens the production database.
+SessionLocal = sessionmaker(autoflush=False, expire_on_commit=False)
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
 
 
 def get_engine() -> Engine:
-    return engine
+    """Return the process-wide engine, creating it on first call.
+
+    The first requests may arrive together on FastAPI's threadpool; the lock
+    makes sure only one of them builds the engine.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                eng = _make_engine()
+                SessionLocal.configure(bind=eng)
+                _engine = eng
+    return _engine
+
+
+def __getattr__(name: str):
+    # Keep ``from src.db.session import engine`` working without an eager engine.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_session() -> Iterator[Session]:
     """FastAPI dependency: yields a session and closes it."""
+    get_engine()
     s = SessionLocal()
     try:
         yield s
@@ -61,6 +85,7 @@ def get_session() -> Iterator[Session]:
 @contextmanager
 def session_scope() -> Iterator[Session]:
     """Context manager for scripts/CLI: commits on success, rolls back on error."""
+    get_engine()
     s = SessionLocal()
     try:
         yield s
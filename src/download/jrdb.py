@@ -1,9 +1,11 @@
 """JRDB file downloader with HTTP Basic auth, ZIP/LZH extraction."""
 from __future__ import annotations
 
+import io
 import time
 import zipfile
 from pathlib import Path
+from typing import BinaryIO
 
 import httpx
 import lhafile
@@ -24,6 +26,16 @@ FILE_TYPES = {
     "KKA": ("Kka/", "zip", "KKA"),  # 競走馬拡張
 }
 
+# Downloads run sequentially against the two JRDB hosts (www.jrdb.com and
+# jrdb.com), so a small pool suffices; keep idle connections alive well past
+# the inter-request delay so the TLS session is reused across dates.
+HTTP_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=60.0)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def _make_client() -> httpx.Client:
+    return httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
 
 class JRDBDownloader:
     """Downloads and extracts JRDB data files."""
@@ -55,19 +67,19 @@ class JRDBDownloader:
             return f"{self.settings.jrdb_base_url}{path_prefix}{full_year}/{filename}"
         return f"{self.settings.jrdb_base_url}{path_prefix}{filename}"
 
-    def _extract_zip(self, archive_path: Path) -> list[Path]:
-        """Extract ZIP archive, return list of extracted file paths."""
+    def _extract_zip(self, archive: Path | BinaryIO) -> list[Path]:
+        """Extract ZIP archive (path or file object), return extracted file paths."""
         extracted = []
-        with zipfile.ZipFile(archive_path, "r") as zf:
+        with zipfile.ZipFile(archive, "r") as zf:
             for name in zf.namelist():
                 zf.extract(name, self.output_dir)
                 extracted.append(self.output_dir / name)
         return extracted
 
-    def _extract_lzh(self, archive_path: Path) -> list[Path]:
-        """Extract LZH archive using lhafile, return list of extracted file paths."""
+    def _extract_lzh(self, archive: Path | BinaryIO) -> list[Path]:
+        """Extract LZH archive (path or file object) using lhafile."""
         extracted = []
-        lha = lhafile.Lhafile(str(archive_path))
+        lha = lhafile.Lhafile(str(archive) if isinstance(archive, Path) else archive)
         for name in lha.namelist():
             data = lha.read(name)
             out_path = self.output_dir / name
@@ -96,12 +108,11 @@ class JRDBDownloader:
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        _, archive_fmt, file_prefix = FILE_TYPES[file_type]
-        archive_path = self.output_dir / f"{file_prefix}{date_str}.{archive_fmt}"
+        archive_fmt = FILE_TYPES[file_type][1]
 
         own_client = client is None
         if own_client:
-            client = httpx.Client()
+            client = _make_client()
 
         try:
             auth = (self.settings.jrdb_user, self.settings.jrdb_pass)
@@ -112,16 +123,12 @@ class JRDBDownloader:
                 response = client.get(url, auth=auth, follow_redirects=True)
             response.raise_for_status()
 
-            archive_path.write_bytes(response.content)
-
+            # Extract straight from the downloaded bytes; the archive itself
+            # is never written to disk.
+            archive = io.BytesIO(response.content)
             if archive_fmt == "zip":
-                extracted = self._extract_zip(archive_path)
-            else:
-                extracted = self._extract_lzh(archive_path)
-
-            # Clean up archive
-            archive_path.unlink()
-            return extracted
+                return self._extract_zip(archive)
+            return self._extract_lzh(archive)
 
         finally:
             if own_client:
@@ -145,7 +152,7 @@ class JRDBDownloader:
         """
         results: dict[str, list[Path]] = {}
 
-        with httpx.Client() as client:
+        with _make_client() as client:
             for i, date_str in enumerate(dates):
                 try:
                     extracted = self.download_file(file_type, date_str, client=client)
@@ -1,6 +1,7 @@
 """Feature engineering pipeline: KYI/SED DataFrames → ML-ready features."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from src.features.columns import (
@@ -11,15 +12,13 @@ from src.features.columns import (
     NUMERICAL_DEFAULTS,
 )
 from src.features.derived import add_derived_features
-from src.parser.engine import build_race_key
+from src.parser.engine import build_race_keys
 
 
 def _add_race_key(df: pd.DataFrame) -> pd.DataFrame:
     """Add race_key column to a parsed JRDB DataFrame."""
     df = df.copy()
-    df["race_key"] = df.apply(
-        lambda row: build_race_key(row.to_dict()), axis=1
-    )
+    df["race_key"] = build_race_keys(df)
     return df
 
 
@@ -48,19 +47,12 @@ def _parse_body_weight_delta(df: pd.DataFrame) -> pd.DataFrame:
     if src is None:
         return df
 
-    def _to_signed(val: object) -> float | None:
-        if val is None:
-            return None
-        s = str(val).strip()
-        if not s or s in {"+", "-", "***"}:
-            return None
-        sign = -1.0 if s.startswith("-") else 1.0
-        digits = "".join(ch for ch in s if ch.isdigit())
-        if not digits:
-            return None
-        return sign * float(digits)
-
-    df["body_weight_delta"] = src.map(_to_signed)
+    # Vectorized: sign from the leading '-', magnitude from the digits.
+    # Blank, bare '+'/'-' and '***' have no digits → NaN.
+    text = src.astype("string").str.strip()
+    magnitude = pd.to_numeric(text.str.replace(r"\D", "", regex=True), errors="coerce")
+    sign = np.where(text.str.startswith("-").fillna(False), -1.0, 1.0)
+    df["body_weight_delta"] = magnitude.astype("float64") * sign
     return df
 
 
@@ -76,14 +68,16 @@ def preprocess(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
 
     # Fill categorical with "Unknown"
-    for col in CATEGORICAL_FEATURES:
-        if col in df.columns:
-            df[col] = df[col].fillna("Unknown").astype(str)
+    cat_cols = [c for c in CATEGORICAL_FEATURES if c in df.columns]
+    if cat_cols:
+        df[cat_cols] = df[cat_cols].fillna("Unknown").astype(str)
 
-    # Fill numerical with defaults
-    for col, default in NUMERICAL_DEFAULTS.items():
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(default)
+    # Fill numerical with defaults — one block assignment + one dict fillna
+    # instead of a column-by-column write.
+    num_defaults = {c: d for c, d in NUMERICAL_DEFAULTS.items() if c in df.columns}
+    if num_defaults:
+        cols = list(num_defaults)
+        df[cols] = df[cols].apply(pd.to_numeric, errors="coerce").fillna(num_defaults)
 
     return df
 
@@ -104,6 +98,11 @@ def build_training_features(
     Returns:
         DataFrame with FEATURE_COLUMNS + is_place label.
     """
+    # Filter out anomalies (取消, 失格, etc.) before any per-row work on SED
+    if "異常区分" in sed_df.columns:
+        anomaly = sed_df["異常区分"]
+        sed_df = sed_df[anomaly.isna() | (anomaly == 0)]
+
     # Add race keys for joining
     kyi = _add_race_key(kyi_df)
     sed = _add_race_key(sed_df)
@@ -120,12 +119,10 @@ def build_training_features(
 
     # Join on race_key + horse_number
     # After _rename_to_features(), 馬番 is already horse_number in both DFs.
-    # SED: 着順 (label) and 異常区分 (filter) are not in FIELD_TO_FEATURE.
+    # SED: 着順 (label) is not in FIELD_TO_FEATURE.
     sed_cols = ["race_key", "horse_number"]
     if "着順" in sed.columns:
         sed_cols.append("着順")
-    if "異常区分" in sed.columns:
-        sed_cols.append("異常区分")
 
     merged = kyi.merge(
         sed[sed_cols],
@@ -134,12 +131,6 @@ def build_training_features(
         suffixes=("", "_sed"),
     )
 
-    # Filter out anomalies (取消, 失格, etc.)
-    if "異常区分" in merged.columns:
-        merged = merged[
-            (merged["異常区分"].isna()) | (merged["異常区分"] == 0)
-        ].copy()
-
     # Create is_place label
     merged[LABEL_COLUMN] = (merged["着順"] <= 3).astype(int)
 
@@ -162,9 +153,8 @@ def build_training_features(
         keep = ["finish_order"] + keep
     if "race_key" in merged.columns:
         keep = ["race_key"] + keep
-    result = merged[keep].copy()
-
-    return result
+    # reindex materializes the selection once; merged[keep].copy() copied twice.
+    return merged.reindex(columns=keep)
 
 
 def build_prediction_features(kyi_df: pd.DataFrame) -> pd.DataFrame:
@@ -197,4 +187,4 @@ def build_prediction_features(kyi_df: pd.DataFrame) -> pd.DataFrame:
 
     # Avoid duplicate columns (horse_number is in both meta and features)
     all_cols = list(dict.fromkeys(keep_meta + available))
-    return kyi[all_cols].copy()
+    return kyi.reindex(columns=all_cols)
@@ -2,33 +2,61 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 
 import modal
 
 
+def _dumps(obj: object) -> str:
+    """Compact JSON for RPC payloads (no whitespace after separators)."""
+    return json.dumps(obj, separators=(",", ":"))
+
+
 class ModalClient:
     """Synchronous wrapper for calling Modal functions from CLI."""
 
-    def __init__(self, app_name: str = "boonta-ml"):
+    def __init__(self, app_name: str = "boonta-ml", volume_name: str = "boonta-models"):
         self.app_name = app_name
+        self.volume_name = volume_name
 
     def _get_function(self, name: str) -> modal.Function:
         return modal.Function.from_name(self.app_name, name)
 
+    def upload_training_data(
+        self,
+        csv_path: Path,
+        remote_path: str = "training/training.csv",
+    ) -> str:
+        """Stream a local training CSV onto the model volume.
+
+        Returns the volume-relative path to pass as ``training_data_path`` so
+        the CSV is not shipped inside the function-call payload.
+        """
+        volume = modal.Volume.from_name(self.volume_name)
+        with volume.batch_upload(force=True) as batch:
+            batch.put_file(str(csv_path), f"/{remote_path}")
+        return remote_path
+
     def train(
         self,
-        csv_data: str,
+        csv_data: str = "",
         model_name: str = "jrdb_predictor",
         time_limit: int = 7200,
         presets: str = "best_quality",
+        training_data_path: str | None = None,
     ) -> dict:
-        """Start training and wait for completion."""
+        """Start training and wait for completion.
+
+        Pass either inline ``csv_data`` or a ``training_data_path`` returned by
+        :meth:`upload_training_data`.
+        """
         train_fn = self._get_function("train_model")
         return train_fn.remote(
             training_data_csv=csv_data,
             model_name=model_name,
             time_limit=time_limit,
             presets=presets,
+            training_data_path=training_data_path,
         )
 
     def train_async(
@@ -67,7 +95,7 @@ class ModalClient:
         """Get is_place probability predictions."""
         predict_fn = self._get_function("predict")
         return predict_fn.remote(
-            features_json=json.dumps(features),
+            features_json=_dumps(features),
             model_name=model_name,
         )
 
@@ -76,20 +104,30 @@ class ModalClient:
         status_fn = self._get_function("get_model_status")
         return status_fn.remote(model_name=model_name)
 
-    def get_feature_importance(self, model_name: str = "jrdb_predictor") -> dict:
-        """Get feature importance from trained model."""
+    def get_feature_importance(
+        self,
+        model_name: str = "jrdb_predictor",
+        subsample_size: int = 5000,
+        num_shuffle_sets: int = 3,
+    ) -> dict:
+        """Get feature importance from trained model (permutation, subsampled)."""
         importance_fn = self._get_function("get_feature_importance")
-        return importance_fn.remote(model_name=model_name)
+        return importance_fn.remote(
+            model_name=model_name,
+            subsample_size=subsample_size,
+            num_shuffle_sets=num_shuffle_sets,
+        )
 
     # === Phase 2: LightGBM lambdarank ===
 
     def train_lambdarank(
         self,
-        csv_data: str,
+        csv_data: str = "",
         model_name: str = "jrdb_ranker",
         num_boost_round: int = 3000,
         learning_rate: float = 0.05,
         early_stopping_rounds: int = 100,
+        training_data_path: str | None = None,
     ) -> dict:
         """Train the per-race ranker. Requires race_key + finish_order in CSV."""
         train_fn = self._get_function("train_lambdarank")
@@ -99,6 +137,7 @@ class ModalClient:
             num_boost_round=num_boost_round,
             learning_rate=learning_rate,
             early_stopping_rounds=early_stopping_rounds,
+            training_data_path=training_data_path,
         )
 
     def predict_lambdarank(
@@ -109,6 +148,6 @@ class ModalClient:
         """Get lambdarank scores + P(win)/P(top2)/P(top3) for one race."""
         predict_fn = self._get_function("predict_lambdarank")
         return predict_fn.remote(
-            features_json=json.dumps(features),
+            features_json=_dumps(features),
             model_name=model_name,
         )
@@ -26,6 +26,7 @@ autogluon_image = (
         "autogluon.tabular[all]==1.4.0",
         "pandas>=2.0.0",
         "numpy>=1.24.0",
+        "pyarrow>=14.0.0",
     )
 )
 
@@ -133,12 +134,13 @@ NUMERICAL_DEFAULTS = {
 def preprocess_features(df: pd.DataFrame) -> pd.DataFrame:
     """Fill missing values and cast types. Mirrors src/features/engineering.preprocess()."""
     df = df.copy()
-    for col in CATEGORICAL_COLS:
-        if col in df.columns:
-            df[col] = df[col].fillna("Unknown").astype(str)
-    for col, default in NUMERICAL_DEFAULTS.items():
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(default)
+    cat_cols = [c for c in CATEGORICAL_COLS if c in df.columns]
+    if cat_cols:
+        df[cat_cols] = df[cat_cols].fillna("Unknown").astype(str)
+    num_defaults = {c: d for c, d in NUMERICAL_DEFAULTS.items() if c in df.columns}
+    if num_defaults:
+        cols = list(num_defaults)
+        df[cols] = df[cols].apply(pd.to_numeric, errors="coerce").fillna(num_defaults)
     return df
 
 
@@ -158,6 +160,41 @@ def create_derived_features(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def prepare_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Single entry point for train/predict: preprocess, then derive features."""
+    return create_derived_features(preprocess_features(df))
+
+
+def load_training_frame(training_data_csv: str, training_data_path: str | None) -> pd.DataFrame:
+    """Read training data uploaded to the volume, or passed inline as CSV text.
+
+    ``training_data_path`` is relative to the volume root (see
+    ``ModalClient.upload_training_data``); the volume is reloaded first so a
+    file uploaded just before the call is visible. Files are parsed with the
+    multithreaded pyarrow reader; results stay numpy-backed.
+    """
+    if training_data_path:
+        model_volume.reload()
+        return pd.read_csv(os.path.join(VOLUME_PATH, training_data_path), engine="pyarrow")
+    return pd.read_csv(StringIO(training_data_csv))
+
+
+def downcast_numeric(df: pd.DataFrame, exclude: tuple[str, ...] = ()) -> pd.DataFrame:
+    """Shrink numeric columns before fit: float64 → float32, int64 → smallest int.
+
+    Halves the bytes the GBM/XGB/CAT histogram builders scan per split.
+    Columns in ``exclude`` (label, metadata) keep their dtype.
+    """
+    df = df.copy()
+    floats = [c for c in df.select_dtypes(include="float64").columns if c not in exclude]
+    if floats:
+        df[floats] = df[floats].astype("float32")
+    for col in df.select_dtypes(include="int64").columns:
+        if col not in exclude:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
 # --- Modal Functions ---
 
 @app.function(
@@ -168,23 +205,27 @@ def create_derived_features(df: pd.DataFrame) -> pd.DataFrame:
     cpu=8.0,
 )
 def train_model(
-    training_data_csv: str,
+    training_data_csv: str = "",
     model_name: str = "jrdb_predictor",
     time_limit: int = 7200,
     presets: str = "best_quality",
     excluded_model_types: list[str] | None = None,
     hyperparameters: dict | None = None,
+    training_data_path: str | None = None,
+    fit_strategy: str = "sequential",
 ) -> dict:
     """Train an AutoGluon model on JRDB feature data.
 
     Phase 1-C defaults: best_quality preset, GBM/CAT/XGB/FASTAI explicit
     hyperparameters (RF/KNN excluded — slow on tabular at this scale).
+
+    Training data comes from ``training_data_path`` on the volume when given,
+    otherwise from the inline ``training_data_csv`` string. ``fit_strategy``
+    is passed through to AutoGluon ("parallel" fits models concurrently).
     """
     from autogluon.tabular import TabularPredictor
 
-    df = pd.read_csv(StringIO(training_data_csv))
-    df = preprocess_features(df)
-    df = create_derived_features(df)
+    df = prepare_features(load_training_frame(training_data_csv, training_data_path))
 
     label = "is_place"
     if label not in df.columns:
@@ -201,6 +242,12 @@ def train_model(
     if "finish_order" in df.columns:
         ignored_columns.append("finish_order")
 
+    df = downcast_numeric(df, exclude=(label, *ignored_columns))
+    # Hand AutoGluon category dtype so it skips its own object → category pass.
+    cat_cols = [c for c in CATEGORICAL_COLS if c in df.columns]
+    if cat_cols:
+        df[cat_cols] = df[cat_cols].astype("category")
+
     model_path = os.path.join(VOLUME_PATH, model_name)
     predictor = TabularPredictor(
         label=label,
@@ -230,6 +277,7 @@ def train_model(
         "presets": presets,
         "hyperparameters": hyperparameters,
         "excluded_model_types": excluded_model_types,
+        "fit_strategy": fit_strategy,
     }
     if ignored_columns:
         fit_kwargs["ignored_columns"] = ignored_columns
@@ -346,11 +394,12 @@ def train_model(
     cpu=8.0,
 )
 def train_lambdarank(
-    training_data_csv: str,
+    training_data_csv: str = "",
     model_name: str = "jrdb_ranker",
     num_boost_round: int = 3000,
     learning_rate: float = 0.05,
     early_stopping_rounds: int = 100,
+    training_data_path: str | None = None,
 ) -> dict:
     """Train a LightGBM lambdarank model on per-race ranking labels.
 
@@ -361,11 +410,8 @@ def train_lambdarank(
     minimizes NLL of actual winners. Stored in metadata for predict-time use.
     """
     import lightgbm as lgb
-    import numpy as np
 
-    df = pd.read_csv(StringIO(training_data_csv))
-    df = preprocess_features(df)
-    df = create_derived_features(df)
+    df = prepare_features(load_training_frame(training_data_csv, training_data_path))
 
     if "race_key" not in df.columns:
         return {"success": False, "error": "race_key column required"}
@@ -386,20 +432,22 @@ def train_lambdarank(
 
     # Cast categoricals
     cat_cols_present = [c for c in CATEGORICAL_COLS if c in feature_cols]
-    X = df[feature_cols].copy()
+    X = df.reindex(columns=feature_cols)  # one copy, no SettingWithCopy chain
     for c in cat_cols_present:
         X[c] = X[c].astype("category")
     y = df["lambda_label"]
 
-    # Race-key based split: last 10% of unique race_keys = validation
-    unique_keys = df["race_key"].drop_duplicates().tolist()
+    # Race-key based split: last 10% of unique race_keys = validation.
+    # df is sorted by race_key, so factorize codes are contiguous per race and
+    # per-race group sizes are a single bincount.
+    race_codes, unique_keys = pd.factorize(df["race_key"])
     cutoff = int(len(unique_keys) * 0.9)
-    val_keys = set(unique_keys[cutoff:])
-    val_mask = df["race_key"].isin(val_keys).to_numpy()
+    val_mask = race_codes >= cutoff
     train_mask = ~val_mask
 
-    train_groups = df.loc[train_mask].groupby("race_key", sort=False).size().tolist()
-    val_groups = df.loc[val_mask].groupby("race_key", sort=False).size().tolist()
+    group_sizes = np.bincount(race_codes, minlength=len(unique_keys))
+    train_groups = group_sizes[:cutoff].tolist()
+    val_groups = group_sizes[cutoff:].tolist()
 
     train_data = lgb.Dataset(
         X.loc[train_mask], y.loc[train_mask], group=train_groups,
@@ -542,8 +590,6 @@ def _pl_top_k_probs(prob_win: list[float]) -> tuple[list[float], list[float]]:
     Uses ``v_i = prob_win_i`` (already normalized) as PL parameters.
     O(N^3) enumeration — fine for N ≤ 18.
     """
-    import numpy as np
-
     v = np.asarray(prob_win, dtype=float)
     N = len(v)
     S = float(v.sum())
@@ -602,7 +648,6 @@ def predict_lambdarank(
     Output: success, scores, prob_win, prob_top2, prob_top3, temperature.
     """
     import lightgbm as lgb
-    import numpy as np
 
     try:
         model_path = os.path.join(VOLUME_PATH, model_name)
@@ -613,10 +658,7 @@ def predict_lambdarank(
             meta = json.load(f)
         T = float(meta.get("optimal_temperature", 1.0))
 
-        features = json.loads(features_json)
-        df = pd.DataFrame(features)
-        df = preprocess_features(df)
-        df = create_derived_features(df)
+        df = prepare_features(pd.DataFrame(json.loads(features_json)))
 
         feature_cols = cfg["feature_cols"]
         for c in feature_cols:
@@ -667,10 +709,7 @@ def predict(
             model_path, require_py_version_match=False,
         )
 
-        features = json.loads(features_json)
-        df = pd.DataFrame(features)
-        df = preprocess_features(df)
-        df = create_derived_features(df)
+        df = prepare_features(pd.DataFrame(json.loads(features_json)))
 
         proba = predictor.predict_proba(df)
         if isinstance(proba, pd.DataFrame) and 1 in proba.columns:
@@ -721,8 +760,17 @@ def get_model_status(model_name: str = "jrdb_predictor") -> dict:
     timeout=60,
     memory=4096,
 )
-def get_feature_importance(model_name: str = "jrdb_predictor") -> dict:
-    """Get feature importance from a trained model."""
+def get_feature_importance(
+    model_name: str = "jrdb_predictor",
+    subsample_size: int = 5000,
+    num_shuffle_sets: int = 3,
+) -> dict:
+    """Get permutation feature importance from a trained model.
+
+    Computed on a ``subsample_size`` row sample of the stored validation/OOF
+    data with ``num_shuffle_sets`` shuffles per feature, which bounds the cost
+    regardless of training set size.
+    """
     from autogluon.tabular import TabularPredictor
 
     try:
@@ -730,14 +778,19 @@ def get_feature_importance(model_name: str = "jrdb_predictor") -> dict:
         predictor = TabularPredictor.load(
             model_path, require_py_version_match=False,
         )
-        importance_df = predictor.feature_importance()
-
-        features = []
-        for name, row in importance_df.iterrows():
-            imp = row["importance"] if "importance" in row.index else row.iloc[0]
-            features.append({"name": str(name), "importance": float(imp)})
+        importance_df = predictor.feature_importance(
+            subsample_size=subsample_size,
+            num_shuffle_sets=num_shuffle_sets,
+        )
 
-        features.sort(key=lambda x: x["importance"], reverse=True)
+        imp = (
+            importance_df["importance"]
+            if "importance" in importance_df.columns
+            else importance_df.iloc[:, 0]
+        ).sort_values(ascending=False)
+        features = [
+            {"name": str(name), "importance": float(value)} for name, value in imp.items()
+        ]
         return {"success": True, "features": features}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -761,9 +814,12 @@ def test_train():
         print(f"Training data not found at {csv_path}")
         return
     csv_data = csv_path.read_text()
+    # Smoke run: skip the slow model families and fit the rest concurrently.
     result = train_model.remote(
         training_data_csv=csv_data,
         time_limit=300,
         presets="medium_quality",
+        excluded_model_types=["RF", "KNN", "NN_TORCH", "FASTAI"],
+        fit_strategy="parallel",
     )
     print(f"Training result: {result}")
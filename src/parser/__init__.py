@@ -3,7 +3,7 @@ from src.parser.bac import BAC_FIELDS
 from src.parser.bac import RECORD_LENGTH as BAC_RECORD_LENGTH
 from src.parser.cyb import CYB_FIELDS
 from src.parser.cyb import RECORD_LENGTH as CYB_RECORD_LENGTH
-from src.parser.engine import build_race_key, parse_file, parse_record
+from src.parser.engine import build_race_key, build_race_keys, parse_file, parse_record
 from src.parser.hjc import HJC_FIELDS
 from src.parser.hjc import RECORD_LENGTH as HJC_RECORD_LENGTH
 from src.parser.kka import KKA_FIELDS
@@ -19,7 +19,7 @@ from src.parser.odds import (
     parse_ow_file,
 )
 from src.parser.sed import RECORD_LENGTH as SED_RECORD_LENGTH
-from src.parser.sed import SED_FIELDS
+from src.parser.sed import SED_FIELDS, SED_LABEL_FIELDS
 from src.parser.spec import FieldSpec, coerce
 
 __all__ = [
@@ -28,9 +28,11 @@ __all__ = [
     "parse_record",
     "parse_file",
     "build_race_key",
+    "build_race_keys",
     "KYI_FIELDS",
     "KYI_RECORD_LENGTH",
     "SED_FIELDS",
+    "SED_LABEL_FIELDS",
     "SED_RECORD_LENGTH",
     "HJC_FIELDS",
     "HJC_RECORD_LENGTH",
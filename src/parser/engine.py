@@ -84,3 +84,24 @@ def build_race_key(record: dict[str, object]) -> str:
     r = _safe_int(record.get("R"))
     nichi_hex = format(nichi, "x")
     return f"{basho:02d}{nen:02d}{kai}{nichi_hex}{r:02d}"
+
+
+def _int_column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Column as int64 with missing/unparseable values → 0 (like ``_safe_int``)."""
+    if name not in df.columns:
+        return pd.Series(0, index=df.index, dtype="int64")
+    return pd.to_numeric(df[name], errors="coerce").fillna(0).astype("int64")
+
+
+def build_race_keys(df: pd.DataFrame) -> pd.Series:
+    """Vectorized :func:`build_race_key` over every row of a parsed DataFrame.
+
+    Produces the same keys as ``df.apply(lambda r: build_race_key(r.to_dict()), axis=1)``
+    without materializing a dict per row.
+    """
+    basho = _int_column(df, "場コード").astype(str).str.zfill(2)
+    nen = _int_column(df, "年").astype(str).str.zfill(2)
+    kai = _int_column(df, "回").astype(str)
+    nichi_hex = _int_column(df, "日").map("{:x}".format)
+    r = _int_column(df, "R").astype(str).str.zfill(2)
+    return (basho + nen + kai + nichi_hex + r).astype(object)
@@ -104,3 +104,11 @@ SED_FIELDS: list[FieldSpec] = [
     FieldSpec("発走時間",     371,   4, "text",     description="発走時間(HHMM)"),
 ]
 # fmt: on
+
+# Subset needed to label KYI rows with results: race key, 馬番, 着順 and
+# 異常区分. Training only joins on these, so decoding them alone skips the
+# other ~70 fields per record.
+SED_LABEL_FIELDS: list[FieldSpec] = [
+    f for f in SED_FIELDS
+    if f.name in {"場コード", "年", "回", "日", "R", "馬番", "着順", "異常区分"}
+]
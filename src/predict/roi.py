@@ -5,6 +5,12 @@ from itertools import combinations
 
 import pandas as pd
 
+from src.predict.multibet import (
+    compute_sanrenpuku_ev,
+    compute_umatan_ev,
+    compute_wide_ev,
+)
+
 
 def evaluate_roi(
     predictions_df: pd.DataFrame,
@@ -468,12 +474,6 @@ def _evaluate_multibet_ev(
         ev_umatan → umatan
         ev_sanrenpuku_box → sanrenpuku
     """
-    from src.predict.multibet import (
-        compute_sanrenpuku_ev,
-        compute_umatan_ev,
-        compute_wide_ev,
-    )
-
     bet_type = {
         "ev_wide": "wide",
         "ev_umatan": "umatan",
@@ -1,6 +1,7 @@
 """展開予想 (race development forecast) text formatter."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from src.predict.betting import (
@@ -21,6 +22,18 @@ PACE_NAMES = {"H": "ハイ", "M": "ミドル", "S": "スロー"}
 IO_LABELS = {1: "最内", 2: "内", 3: "中", 4: "外", 5: "大外"}
 
 
+def _build_lut(names: dict[int, str]) -> np.ndarray:
+    """Dense label array indexed by code; unmapped codes hold ``""``."""
+    lut = np.full(max(names) + 1, "", dtype=object)
+    for code, name in names.items():
+        lut[code] = name
+    return lut
+
+
+_STYLE_LUT = _build_lut(RUNNING_STYLE_NAMES)
+_IO_LUT = _build_lut(IO_LABELS)
+
+
 def _to_int(value, default: int = 0) -> int:
     """Convert a cell value to int, tolerating float strings like '2.0' and NaN."""
     if value is None or (isinstance(value, float) and pd.isna(value)):
@@ -31,6 +44,19 @@ def _to_int(value, default: int = 0) -> int:
         return default
 
 
+def _code_labels(df: pd.DataFrame, column: str, lut: np.ndarray, default: str) -> np.ndarray:
+    """Vectorized ``names.get(_to_int(v), default)`` over a column of codes."""
+    out = np.full(len(df), default, dtype=object)
+    if column not in df.columns:
+        return out
+    codes = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+    idx = np.flatnonzero(np.isfinite(codes) & (codes >= 0) & (codes < len(lut)))
+    labels = lut[codes[idx].astype(np.intp)]
+    known = labels != ""
+    out[idx[known]] = labels[known]
+    return out
+
+
 def format_tenkai(
     features_df: pd.DataFrame,
     predictions: list[float] | None = None,
@@ -112,12 +138,15 @@ def _format_pace(df: pd.DataFrame) -> str:
 
     # Identify front runners
     if "running_style" in df.columns and "horse_number" in df.columns:
-        nige = df[df["running_style"].astype(str) == "1"]
+        # Compare numeric codes once: running_style may arrive as int, float
+        # or the preprocessed string ("1" / "1.0"), so avoid string equality.
+        style = pd.to_numeric(df["running_style"], errors="coerce")
+        nige = df[style == 1]
         if len(nige) > 0:
             names = _horse_labels(nige)
             lines.append(f"  逃げ馬: {', '.join(names)}")
 
-        senko = df[df["running_style"].astype(str).isin(["1", "2"])]
+        senko = df[style.isin((1, 2))]
         if len(senko) > 1:
             names = _horse_labels(senko)
             lines.append(f"  先行争い: {', '.join(names)}")
@@ -133,11 +162,14 @@ def _format_position_table(df: pd.DataFrame) -> str:
     lines.append(header)
 
     sorted_df = df.sort_values("goal_position") if "goal_position" in df.columns else df
+    sorted_df = sorted_df.head(18)
+    styles = _code_labels(sorted_df, "running_style", _STYLE_LUT, "自在")
+    ios = _code_labels(sorted_df, "goal_io", _IO_LUT, "-")
 
-    for _, row in sorted_df.head(18).iterrows():
+    for i, (_, row) in enumerate(sorted_df.iterrows()):
         umaban = _to_int(row.get("horse_number"))
         name = str(row.get("horse_name", ""))[:7]
-        style = RUNNING_STYLE_NAMES.get(_to_int(row.get("running_style")), "自在")
+        style = styles[i]
         mid = _to_int(row.get("mid_position")) if pd.notna(row.get("mid_position")) else "-"
         late = (
             _to_int(row.get("late3f_position"))
@@ -149,7 +181,7 @@ def _format_position_table(df: pd.DataFrame) -> str:
             if pd.notna(row.get("goal_position"))
             else "-"
         )
-        io = IO_LABELS.get(_to_int(row.get("goal_io")), "-")
+        io = ios[i]
         lines.append(f"  {umaban:4d}  {name:<14}  {style:<4}  {mid:>4}  {late:>4}  {goal:>4}  {io}")
 
     return "\n".join(lines)
@@ -180,9 +212,10 @@ def _format_advantages(df: pd.DataFrame) -> str:
             (df["goal_position"] <= 3) &
             (df["goal_io"] <= 2)
         ]
-        for _, row in favorable.iterrows():
+        styles = _code_labels(favorable, "running_style", _STYLE_LUT, "")
+        for i, (_, row) in enumerate(favorable.iterrows()):
             label = _horse_label(row)
-            style = RUNNING_STYLE_NAMES.get(_to_int(row.get("running_style")), "")
+            style = styles[i]
             lines.append(f"  ★有利: {label} ({style} + 内枠)")
             found = True
 
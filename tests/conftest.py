@@ -1 +1,182 @@
 """Shared test fixtures for Boonta v2."""
+from contextvars import ContextVar
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.db.models import Base, HorseEntry, Race
+
+SEED_RACE_KEY = "09261511"
+# (horse_number, name, running_style, odds)
+_SEED_ENTRIES: tuple[tuple[int, str, int, float], ...] = (
+    (1, "ベラジオオペラ", 2, 3.2),
+    (2, "ローシャムパーク", 3, 4.5),
+    (3, "ジャスティンパレス", 4, 6.0),
+    (4, "タスティエーラ", 1, 12.8),
+)
+
+# Session the API dependency override hands out; bound per test by ``client``.
+_current_session: ContextVar[Session] = ContextVar("_current_session")
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """In-memory SQLite engine; the schema is created once per test session.
+
+    StaticPool keeps a single connection (one in-memory database) that any
+    thread may use, e.g. the worker thread behind FastAPI's TestClient.
+    """
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        echo=False,  # opt in with caplog when debugging; SQL logging dwarfs query time
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _record):
+        # pysqlite's own BEGIN handling breaks SAVEPOINT; let SQLAlchemy emit it.
+        dbapi_conn.isolation_level = None
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA foreign_keys=ON")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def db_connection(db_engine):
+    """The one Connection every test session is bound to.
+
+    Session-scoped fixtures (e.g. ``seed_race``) are set up before any
+    test's outer transaction begins, so their commits persist.
+    """
+    with db_engine.connect() as conn:
+        yield conn
+
+
+@pytest.fixture(scope="session")
+def seed_race(db_connection) -> Race:
+    """Commit one 阪神11R race with 4 entries once per test session.
+
+    Returns the detached row (ids and columns stay loaded). Tests that need
+    it attached use the ``race`` / ``horse_entry`` fixtures; their changes
+    are rolled back with ``db_session``.
+    """
+    race = Race(
+        race_key=SEED_RACE_KEY,
+        held_on=date(2026, 4, 5),
+        venue_code="09",
+        venue="阪神",
+        race_no=11,
+        name="大阪杯",
+        head_count=4,
+        source="KYI",
+        ingested_at=datetime(2026, 4, 4, 12, 0),
+    )
+    with Session(bind=db_connection, expire_on_commit=False) as session:
+        session.add(race)
+        session.flush()
+        # Entries go in as one executemany; no ORM objects to build or track.
+        session.execute(insert(HorseEntry), [
+            {"race_id": race.id, "horse_number": n, "name": name,
+             "running_style": style, "odds": odds}
+            for n, name, style, odds in _SEED_ENTRIES
+        ])
+        session.commit()
+        # Load the entries once so the detached race carries them.
+        session.refresh(race, ["horses"])
+    return race
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """Session whose writes are rolled back after each test.
+
+    The session joins an outer transaction via a SAVEPOINT, so even
+    ``session.commit()`` in code under test never persists past the test.
+    """
+    trans = db_connection.begin()
+    session = Session(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    yield session
+    session.close()
+    trans.rollback()
+
+
+@pytest.fixture
+def sql_selects(db_engine) -> list[str]:
+    """SELECT statements sent to the test engine while the test runs.
+
+    Lets tests pin the number of queries a code path issues, so an N+1
+    lazy load shows up as a failing count rather than a slow endpoint.
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def race(db_session, seed_race) -> Race:
+    """The seeded race, attached to this test's session."""
+    return db_session.get(Race, seed_race.id)
+
+
+@pytest.fixture
+def horse_entry(db_session, seed_race) -> HorseEntry:
+    """Horse #1 of the seeded race, attached to this test's session."""
+    return db_session.get(HorseEntry, seed_race.horses[0].id)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported only once an API test actually runs."""
+    from src.api.main import app as _app
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+def api_client(app):
+    """One TestClient (and app lifespan) shared by every API test.
+
+    ``get_session`` is overridden once for the whole session and resolves to
+    whichever ``db_session`` the running test bound via ``client``.
+    """
+    from fastapi.testclient import TestClient
+
+    from src.db.session import get_session
+
+    app.dependency_overrides[get_session] = lambda: _current_session.get()
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.fixture
+def client(api_client, db_session):
+    """``api_client`` with requests served from this test's ``db_session``."""
+    token = _current_session.set(db_session)
+    yield api_client
+    _current_session.reset(token)
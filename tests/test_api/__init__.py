@@ -0,0 +1,14 @@
+"""API route templates and response helpers shared by the router tests."""
+RACES_URL = "/api/races"
+RACE_URL = "/api/races/{}"
+PREDICT_URL = "/api/races/{}/predict"
+MULTIBET_URL = "/api/races/{}/multibet"
+PREDICT_BATCH_URL = "/api/races/predict-batch"
+BACKTEST_RUN_URL = "/api/backtest/run"
+COVERAGE_URL = "/api/system/coverage"
+
+
+def ok(resp, code: int = 200):
+    """Assert the status code (showing the body on failure) and return the JSON."""
+    assert resp.status_code == code, resp.text
+    return resp.json()
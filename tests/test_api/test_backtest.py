@@ -0,0 +1,13 @@
+"""Tests for the backtest run endpoint's request validation."""
+from tests.test_api import BACKTEST_RUN_URL, ok
+
+# Shared request body; tests override single fields with {**_RUN_BODY, ...}.
+_RUN_BODY = {"date_from": "2026-04-05", "date_to": "2026-04-05"}
+
+
+class TestRunBacktest:
+    def test_unknown_strategy_is_400(self, client):
+        ok(client.post(BACKTEST_RUN_URL, json={**_RUN_BODY, "strategy": "martingale"}), 400)
+
+    def test_no_predictions_is_409(self, client, seed_race):
+        ok(client.post(BACKTEST_RUN_URL, json=_RUN_BODY), 409)
@@ -0,0 +1,16 @@
+"""Tests for the dataset coverage endpoint."""
+from tests.test_api import COVERAGE_URL, ok
+
+
+class TestCoverage:
+    def test_years_default_to_seeded_range(self, client, seed_race):
+        # Bounds come from the seed race, so the result never depends on today's date.
+        body = ok(client.get(COVERAGE_URL))
+        assert body["years"] == [seed_race.held_on.year]
+        assert body["counts"][0][seed_race.held_on.month - 1] == 1
+
+    def test_explicit_range_pads_empty_years(self, client, seed_race):
+        body = ok(client.get(COVERAGE_URL, params={"from_year": 2025, "to_year": 2026}))
+        assert body["years"] == [2025, 2026]
+        assert body["counts"][0] == [0] * 12
+        assert sum(body["counts"][1]) == 1
@@ -0,0 +1,12 @@
+"""Tests for the model router's calibration binning."""
+import pytest
+
+from src.api.routers.model import _calibration_bin
+
+
+@pytest.mark.parametrize(
+    ("prob", "expected"),
+    [(-0.1, 0), (0.0, 0), (0.05, 0), (0.55, 5), (0.99, 9), (1.0, 9), (1.2, 9)],
+)
+def test_calibration_bin_is_clamped(prob, expected):
+    assert _calibration_bin(prob) == expected
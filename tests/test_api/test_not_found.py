@@ -0,0 +1,21 @@
+"""404 handling across API endpoints, one parametrized case per route."""
+import pytest
+
+from tests.test_api import MULTIBET_URL, PREDICT_BATCH_URL, PREDICT_URL, RACE_URL, ok
+
+UNKNOWN_KEY = "00000000"
+_BATCH_BODY = {"date": "1999-01-01"}
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "kwargs"),
+    [
+        ("GET", RACE_URL.format(UNKNOWN_KEY), {}),
+        ("POST", PREDICT_URL.format(UNKNOWN_KEY), {}),
+        ("GET", MULTIBET_URL.format(UNKNOWN_KEY), {}),
+        ("POST", PREDICT_BATCH_URL, {"json": _BATCH_BODY}),
+    ],
+    ids=["race-detail", "predict", "multibet", "predict-batch"],
+)
+def test_not_found(client, method, url, kwargs):
+    ok(client.request(method, url, **kwargs), 404)
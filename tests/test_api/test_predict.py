@@ -0,0 +1,105 @@
+"""Tests for the prediction router's upsert path."""
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+from sqlalchemy import func, insert, select
+
+from src.api.routers.predict import _predict_one
+from src.db.models import Prediction, Race
+from tests.test_api import PREDICT_BATCH_URL, PREDICT_URL, ok
+
+# Per-horse feature columns for the 4-horse seed race; never mutated.
+_FEATURE_COLUMNS: dict[str, tuple] = {
+    "horse_number": (1, 2, 3, 4),
+    "odds": (3.2, 4.5, 6.0, 12.8),
+    "fukusho_odds": (1.4, 1.8, 2.2, 3.5),
+    "idm": (55.0, 52.0, 50.0, 45.0),
+}
+
+
+def _race_feats(race_key: str) -> pd.DataFrame:
+    return pd.DataFrame({"race_key": [race_key] * 4, **_FEATURE_COLUMNS})
+
+
+def _run(session, race, feats, probs: list[float]):
+    with patch("src.model.client.ModalClient") as client_cls:
+        client = client_cls.return_value
+        client.predict.return_value = {"success": True, "predictions": probs}
+        client.predict_lambdarank.return_value = {"success": False}
+        return _predict_one(session, race, "v1", feats)
+
+
+class TestPredictOne:
+    def test_inserts_then_updates_in_place(self, db_session, race):
+        feats = _race_feats(race.race_key)
+
+        assert _run(db_session, race, feats, [0.6, 0.4, 0.3, 0.1]) == (4, "")
+        db_session.flush()
+        assert _run(db_session, race, feats, [0.5, 0.5, 0.3, 0.2]) == (4, "")
+        db_session.flush()
+
+        assert db_session.scalar(select(func.count()).select_from(Prediction)) == 4
+        probs = db_session.scalars(
+            select(Prediction.prob).order_by(Prediction.horse_entry_id)
+        ).all()
+        assert probs == [0.5, 0.5, 0.3, 0.2]
+
+    def test_missing_race_rows(self, db_session, race):
+        written, err = _predict_one(db_session, race, "v1", _race_feats("00000000"))
+        assert written == 0
+        assert race.race_key in err
+
+
+class TestPredictRaceEndpoint:
+    def test_response_includes_new_predictions(self, client, race):
+        feats = _race_feats(race.race_key)
+        with patch("src.api.routers.predict._load_features", return_value=(feats, "")), \
+                patch("src.model.client.ModalClient") as client_cls:
+            modal = client_cls.return_value
+            modal.predict.return_value = {"success": True, "predictions": [0.6, 0.4, 0.3, 0.1]}
+            modal.predict_lambdarank.return_value = {"success": False}
+            resp = client.post(PREDICT_URL.format(race.race_key))
+
+        body = ok(resp)
+        assert body["model_version"] == "jrdb_predictor@latest"
+        assert [h["prob"] for h in body["horses"]] == [0.6, 0.4, 0.3, 0.1]
+
+
+class TestPredictBatchEndpoint:
+    @staticmethod
+    def _add_second_race(db_session) -> None:
+        """阪神12R on the seed race's date, with no rows in the KYI features."""
+        db_session.execute(insert(Race), [{
+            "race_key": "09261512", "held_on": date(2026, 4, 5), "venue_code": "09",
+            "venue": "阪神", "race_no": 12,
+            "source": "KYI", "ingested_at": datetime(2026, 4, 4, 12, 0),
+        }])
+
+    def test_parses_kyi_once_and_reports_per_race(self, client, db_session, seed_race):
+        self._add_second_race(db_session)
+        feats = _race_feats(seed_race.race_key)
+        with patch("src.api.routers.predict._kyi_path_for",
+                   return_value=(Path("KYI260405.txt"), "")), \
+                patch("src.api.routers.predict.parse_file") as parse, \
+                patch("src.api.routers.predict.build_prediction_features", return_value=feats), \
+                patch("src.model.client.ModalClient") as client_cls:
+            modal = client_cls.return_value
+            modal.predict.return_value = {"success": True, "predictions": [0.6, 0.4, 0.3, 0.1]}
+            modal.predict_lambdarank.return_value = {"success": False}
+            body = ok(client.post(PREDICT_BATCH_URL, json={"date": "2026-04-05"}))
+
+        assert parse.call_count == 1
+        assert [(j["race_key"], j["status"]) for j in body["jobs"]] == [
+            (seed_race.race_key, "ok"), ("09261512", "error"),
+        ]
+
+    def test_malformed_kyi_fails_each_race_not_request(self, client, db_session, seed_race):
+        self._add_second_race(db_session)
+        with patch("src.api.routers.predict._kyi_path_for",
+                   return_value=(Path("KYI260405.txt"), "")), \
+                patch("src.api.routers.predict.parse_file", side_effect=ValueError("bad record")):
+            body = ok(client.post(PREDICT_BATCH_URL, json={"date": "2026-04-05"}))
+
+        assert [(j["status"], j["error"]) for j in body["jobs"]] == [("error", "bad record")] * 2
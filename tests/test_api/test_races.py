@@ -0,0 +1,115 @@
+"""Tests for the race list / detail endpoints."""
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert
+
+from src.db.models import Prediction, Race
+from tests.test_api import RACE_URL, RACES_URL, ok
+
+# Prediction timestamps around race day (2026-04-05), oldest first.
+_PREDICTED_AT: tuple[datetime, ...] = (
+    datetime(2026, 4, 4, 9, 0),
+    datetime(2026, 4, 5, 8, 0),
+    datetime(2026, 4, 5, 9, 0),
+)
+
+# Column defaults shared by every test prediction; specs override them.
+# predicted_at is NOT NULL without a column default, so pin the newest stamp.
+_PREDICTION_DEFAULTS: dict = {
+    "model_version": "v1", "ev_tan": 0.66, "ev_fuku": 0.87, "predicted_at": _PREDICTED_AT[-1],
+}
+
+
+def _add_predictions(db_session, specs: list[dict]) -> None:
+    """Insert one prediction row per spec as a single executemany."""
+    db_session.execute(insert(Prediction), [{**_PREDICTION_DEFAULTS, **spec} for spec in specs])
+
+
+def _add_races(db_session, rows: list[dict]) -> None:
+    """Insert extra races on the seed race's date as a single executemany."""
+    db_session.execute(insert(Race), [
+        {"held_on": date(2026, 4, 5), "source": "KYI", "ingested_at": datetime(2026, 4, 4, 12, 0),
+         **row}
+        for row in rows
+    ])
+
+
+class TestListRaces:
+    @pytest.mark.parametrize("held_on, expected", [("2026-04-05", 1), ("2026-04-06", 0)])
+    def test_filters_by_date(self, client, seed_race, held_on, expected):
+        assert len(ok(client.get(RACES_URL, params={"date": held_on}))) == expected
+
+    def test_ordered_by_venue_then_race_no(self, client, db_session, seed_race):
+        _add_races(db_session, [
+            {"race_key": "09261512", "venue_code": "09", "venue": "阪神", "race_no": 12},
+            {"race_key": "06261501", "venue_code": "06", "venue": "中山", "race_no": 1},
+            {"race_key": "09261501", "venue_code": "09", "venue": "阪神", "race_no": 1},
+        ])
+        races = ok(client.get(RACES_URL, params={"date": "2026-04-05"}))
+        assert [r["race_key"] for r in races] == [
+            "06261501", "09261501", seed_race.race_key, "09261512",
+        ]
+
+    def test_list_is_three_selects_regardless_of_size(
+        self, client, db_session, seed_race, sql_selects
+    ):
+        _add_races(db_session, [
+            {"race_key": key, "venue_code": "06", "venue": "中山", "race_no": n}
+            for n, key in enumerate(("06261501", "06261502", "06261503"), start=1)
+        ])
+        sql_selects.clear()
+
+        races = ok(client.get(RACES_URL, params={"date": "2026-04-05"}))
+        assert len(races) == 4
+        # races, then horses and predictions via selectinload — never one per race/horse.
+        assert len(sql_selects) == 3
+
+    def test_item_without_predictions(self, client, seed_race):
+        races = ok(client.get(RACES_URL, params={"date": "2026-04-05"}))
+        assert races[0]["race_key"] == seed_race.race_key
+        assert races[0]["status"] == "NO_PREDICTION"
+        assert len(races[0]["horses"]) == 4
+
+
+class TestGetRace:
+    def test_detail_sorted_by_horse_number(self, client, seed_race):
+        body = ok(client.get(RACE_URL.format(seed_race.race_key)))
+        assert body["race"]["name"] == "大阪杯"
+        assert [h["horse_number"] for h in body["horses"]] == [1, 2, 3, 4]
+        assert body["updated_at"] is None
+
+    def test_latest_prediction_is_attached(self, client, db_session, horse_entry):
+        _add_predictions(db_session, [
+            {"horse_entry_id": horse_entry.id, "prob": 0.62},
+        ])
+
+        body = ok(client.get(RACE_URL.format(horse_entry.race.race_key)))
+        assert body["horses"][0]["prob"] == 0.62
+        assert body["horses"][1]["prob"] is None
+
+    def test_newest_of_several_predictions_wins(self, client, db_session, seed_race):
+        first, second = (h.id for h in seed_race.horses[:2])
+        _add_predictions(db_session, [
+            {"horse_entry_id": first, "prob": 0.40, "model_version": "v0",
+             "predicted_at": _PREDICTED_AT[0]},
+            {"horse_entry_id": first, "prob": 0.55},
+            {"horse_entry_id": second, "prob": 0.30, "predicted_at": _PREDICTED_AT[1]},
+        ])
+
+        body = ok(client.get(RACE_URL.format(seed_race.race_key)))
+        assert [h["prob"] for h in body["horses"][:2]] == [0.55, 0.30]
+        assert body["updated_at"] == _PREDICTED_AT[2].isoformat()
+
+    def test_detail_eager_loads_in_three_selects(self, client, db_session, seed_race,
+                                                 sql_selects):
+        _add_predictions(db_session, [
+            {"horse_entry_id": h.id, "prob": 0.25} for h in seed_race.horses
+        ])
+        sql_selects.clear()
+
+        body = ok(client.get(RACE_URL.format(seed_race.race_key)))
+        assert [h["prob"] for h in body["horses"]] == [0.25] * 4
+        # race, horses, predictions: selectinload keeps each one-to-many to one
+        # compact IN query instead of a joined cartesian row set or lazy loads.
+        assert len(sql_selects) == 3
@@ -0,0 +1,57 @@
+"""Tests for backtest run persistence."""
+from datetime import date
+
+from sqlalchemy import func, select
+
+from src.backtest.runner import _persist_run
+from src.db.models import BacktestDetail, BacktestRun, BacktestSensitivity
+
+HELD_ON = date(2026, 4, 5)
+
+
+def _persist(session, race_key: str, result: dict) -> BacktestRun:
+    return _persist_run(
+        session,
+        strategy="fukusho_top3",
+        date_from=HELD_ON,
+        date_to=HELD_ON,
+        ev_threshold=None,
+        model_version="v1",
+        result=result,
+        held_on_lookup={race_key: HELD_ON},
+    )
+
+
+class TestPersistRun:
+    def test_writes_details_for_known_races(self, db_session, race):
+        result = {
+            "race_count": 2,
+            "total_bets": 600,
+            "total_return": 350,
+            "hit_count": 1,
+            "roi": 58.3,
+            "details": [
+                {"race_key": race.race_key, "bets": 300, "return": 350, "hit": True},
+                {"race_key": "00000000", "bets": 300, "return": 0, "hit": False},
+            ],
+        }
+        run = _persist(db_session, race.race_key, result)
+        db_session.flush()
+
+        assert run.roi == 58.3
+        detail = db_session.scalar(select(BacktestDetail).where(BacktestDetail.run_id == run.id))
+        assert detail.race_id == race.id
+        assert (detail.bets, detail.return_amount, detail.hit) == (300, 350, 1)
+
+    def test_rerun_replaces_previous_run(self, db_session, race):
+        result = {"details": [{"race_key": race.race_key, "bets": 100, "return": 0}]}
+        first = _persist(db_session, race.race_key, result)
+        db_session.add(BacktestSensitivity(run_id=first.id, ev_threshold=1.0, roi=80.0))
+        db_session.flush()
+        second = _persist(db_session, race.race_key, result)
+        db_session.flush()
+
+        assert db_session.scalar(select(func.count()).select_from(BacktestRun)) == 1
+        assert db_session.scalar(select(func.count()).select_from(BacktestSensitivity)) == 0
+        run_ids = db_session.scalars(select(BacktestDetail.run_id)).all()
+        assert run_ids == [second.id]
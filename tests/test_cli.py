@@ -1,7 +1,17 @@
 """Tests for CLI commands."""
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
 from click.testing import CliRunner
 
-from cli import _generate_dates, cli
+from cli import (
+    _generate_dates,
+    _parse_files,
+    _training_cache_path,
+    _write_training_cache,
+    cli,
+)
+from src.parser.spec import FieldSpec
 
 
 class TestCLI:
@@ -22,6 +32,12 @@ class TestCLI:
         result = runner.invoke(cli, ["parse", "--help"])
         assert result.exit_code == 0
 
+    def test_serve_help_lists_loop_choices(self):
+        runner = CliRunner()
+        result = runner.invoke(cli, ["serve", "--help"])
+        assert result.exit_code == 0
+        assert "uvloop" in result.output
+
     def test_predict_help(self):
         runner = CliRunner()
         result = runner.invoke(cli, ["predict", "--help"])
@@ -64,3 +80,84 @@ class TestGenerateDates:
     def test_format_is_yymmdd(self):
         dates = _generate_dates("20260101", "20260101")
         assert dates == ["260101"]
+
+
+class TestParseFiles:
+    def test_streams_all_files_into_one_csv(self, tmp_path):
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        (raw / "KYI260405.txt").write_bytes(b"01\r\n02\r\n")
+        (raw / "KYI260406.txt").write_bytes(b"03\r\n")
+        settings = MagicMock(data_raw_dir=raw, data_processed_dir=tmp_path)
+        fields = [FieldSpec("n", 1, 2, "numeric")]
+
+        _parse_files(settings, fields, 4, "KYI", "KYI")
+
+        combined = pd.read_csv(tmp_path / "kyi.csv")
+        assert combined["n"].tolist() == [1, 2, 3]
+
+    def test_empty_first_file_keeps_header(self, tmp_path):
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        (raw / "KYI260405.txt").write_bytes(b"")
+        (raw / "KYI260406.txt").write_bytes(b"01\r\n")
+        settings = MagicMock(data_raw_dir=raw, data_processed_dir=tmp_path)
+
+        _parse_files(settings, [FieldSpec("n", 1, 2, "numeric")], 4, "KYI", "KYI")
+
+        assert (tmp_path / "kyi.csv").read_text() == "n\n1\n"
+
+    def test_all_failures_keep_previous_csv(self, tmp_path):
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        (raw / "KYI260405.txt").write_bytes(b"01\r\n")
+        (tmp_path / "kyi.csv").write_text("n\n7\n")
+        settings = MagicMock(data_raw_dir=raw, data_processed_dir=tmp_path)
+
+        with patch("src.parser.engine.parse_file", side_effect=ValueError("bad")):
+            _parse_files(settings, [FieldSpec("n", 1, 2, "numeric")], 4, "KYI", "KYI")
+
+        assert (tmp_path / "kyi.csv").read_text() == "n\n7\n"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestTrainingCachePath:
+    def _settings(self, tmp_path):
+        return MagicMock(project_root=tmp_path, data_processed_dir=tmp_path / "processed")
+
+    def test_stable_for_same_inputs(self, tmp_path):
+        raw = tmp_path / "KYI260405.txt"
+        raw.write_bytes(b"x")
+        settings = self._settings(tmp_path)
+        assert _training_cache_path(settings, [raw]) == _training_cache_path(settings, [raw])
+
+    def test_changes_when_input_changes(self, tmp_path):
+        raw = tmp_path / "KYI260405.txt"
+        raw.write_bytes(b"x")
+        settings = self._settings(tmp_path)
+        before = _training_cache_path(settings, [raw])
+        raw.write_bytes(b"xy")
+        assert _training_cache_path(settings, [raw]) != before
+
+    def test_changes_when_cli_build_code_changes(self, tmp_path):
+        raw = tmp_path / "KYI260405.txt"
+        raw.write_bytes(b"x")
+        fake_cli = tmp_path / "cli.py"
+        fake_cli.write_text("SED_LABEL_FIELDS = ...\n")
+        settings = self._settings(tmp_path)
+        with patch("cli.__file__", str(fake_cli)):
+            before = _training_cache_path(settings, [raw])
+            fake_cli.write_text("SED_LABEL_FIELDS = [...]\n")
+            assert _training_cache_path(settings, [raw]) != before
+
+    def test_write_prunes_older_caches(self, tmp_path):
+        stale = tmp_path / "training_features_0000000000000000.pkl"
+        stale.write_bytes(b"old")
+        other = tmp_path / "training.csv"
+        other.write_text("kept")
+        cache = tmp_path / "training_features_1111111111111111.pkl"
+
+        _write_training_cache(cache, pd.DataFrame({"idm": [50.0]}))
+
+        assert {p.name for p in tmp_path.iterdir()} == {cache.name, other.name}
+        assert pd.read_pickle(cache)["idm"].tolist() == [50.0]
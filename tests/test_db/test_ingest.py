@@ -0,0 +1,182 @@
+"""Tests for DB ingest (KYI / BAC / SED / HJC upserts)."""
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import func, select
+
+from src.db.ingest import (
+    ingest_bac,
+    ingest_cyb,
+    ingest_hjc,
+    ingest_kyi,
+    ingest_race_odds,
+    ingest_sed,
+)
+from src.db.models import CybRecord, HjcPayout, HorseEntry, Race, RaceOdds
+
+HELD_ON = date(2026, 4, 5)
+
+
+def _make_kyi_df() -> pd.DataFrame:
+    """Two races: 中山11R (3 horses) and 東京1R (2 horses)."""
+    return pd.DataFrame({
+        "場コード": [6, 6, 6, 5, 5],
+        "年": [26] * 5,
+        "回": [2] * 5,
+        "日": [10] * 5,
+        "R": [11, 11, 11, 1, 1],
+        "馬番": [1, 2, 3, 1, 2],
+        "馬名": ["ドウデュース", "リバティアイランド", "タスティエーラ", "テスト馬A", "テスト馬B"],
+        "基準オッズ": [5.2, 8.0, 3.5, 2.0, 4.0],
+        "ペース予想": ["M", "M", "H", "S", "S"],
+    })
+
+
+KYI_RACE_KEYS = ["06262a11", "05262a01"]
+
+
+def _count(session, model) -> int:
+    """Rows of ``model`` belonging to the races in _make_kyi_df (ignores the seed race)."""
+    stmt = select(func.count()).select_from(model)
+    if model is not Race:
+        stmt = stmt.join(Race)
+    return session.scalar(stmt.where(Race.race_key.in_(KYI_RACE_KEYS)))
+
+
+class TestIngestKyi:
+    def test_creates_races_and_entries(self, db_session):
+        touched = ingest_kyi(db_session, _make_kyi_df(), HELD_ON)
+
+        # No caller flush: later ingest steps in the same session must see the rows.
+        assert touched == 2
+        race = db_session.scalar(select(Race).where(Race.race_key == "06262a11"))
+        assert race.venue == "中山"
+        assert race.head_count == 3
+        assert race.pace_forecast == "M"
+        assert _count(db_session, HorseEntry) == 5
+
+    def test_reingest_updates_in_place(self, db_session):
+        ingest_kyi(db_session, _make_kyi_df(), HELD_ON)
+        db_session.flush()
+        df = _make_kyi_df()
+        df["基準オッズ"] = [6.0, 8.0, 3.5, 2.0, 4.0]
+        ingest_kyi(db_session, df, HELD_ON)
+        db_session.flush()
+
+        assert _count(db_session, HorseEntry) == 5
+        entry = db_session.scalar(
+            select(HorseEntry).join(Race)
+            .where(Race.race_key == "06262a11", HorseEntry.horse_number == 1)
+        )
+        assert entry.odds == 6.0
+
+    def test_reingest_loads_races_and_entries_in_two_selects(self, db_session, sql_selects):
+        ingest_kyi(db_session, _make_kyi_df(), HELD_ON)
+        db_session.expire_all()
+        sql_selects.clear()
+
+        ingest_kyi(db_session, _make_kyi_df(), HELD_ON)
+        # One IN query for the races, one selectinload for their entries.
+        assert len(sql_selects) == 2
+
+    def test_commit_is_rolled_back_after_test(self, db_session):
+        ingest_kyi(db_session, _make_kyi_df(), HELD_ON)
+        db_session.commit()
+        assert _count(db_session, Race) == 2
+
+    def test_previous_commit_did_not_leak(self, db_session):
+        assert _count(db_session, Race) == 0
+
+
+class TestIngestBac:
+    def test_creates_race_and_drops_malformed_keys(self, db_session):
+        df = pd.DataFrame({
+            "場コード": [6, 99],
+            "年": [26, 26],
+            "回": [2, 2],
+            "日": [1, 1],
+            "R": [11, 11],
+            "レース名": ["皐月賞", "ゴースト"],
+            "発走時間": ["1540", "1540"],
+        })
+        assert ingest_bac(db_session, df, HELD_ON) == 1
+
+        race = db_session.scalar(select(Race).where(Race.race_key == "06262111"))
+        assert race.name == "皐月賞"
+        assert race.post_time == "15:40"
+        assert race.source == "BAC"
+
+
+class TestIngestSedAndHjc:
+    def test_skip_races_without_kyi(self, db_session):
+        df = _make_kyi_df()[["場コード", "年", "回", "日", "R"]]
+        assert ingest_sed(db_session, df, HELD_ON) == 0
+        assert ingest_hjc(db_session, df, HELD_ON) == 0
+
+    def test_backfill_existing_race(self, db_session, race):
+        sed = pd.DataFrame({
+            "場コード": [9], "年": [26], "回": [1], "日": [5], "R": [11],
+            "レース名": ["中山記念"], "芝ダ障害コード": [1], "馬場状態": ["12"],
+        })
+        assert ingest_sed(db_session, sed, HELD_ON) == 1
+        hjc = pd.DataFrame({
+            "場コード": [9], "年": [26], "回": [1], "日": [5], "R": [11],
+            "単勝馬番1": [3], "単勝払戻1": [350],
+        })
+        assert ingest_hjc(db_session, hjc, HELD_ON) == 1
+        db_session.flush()
+
+        assert race.name == "中山記念"
+        assert race.condition == "1"
+        assert race.source == "KYI+SED"
+        assert len(race.horses) == 4
+        payout = db_session.scalar(select(HjcPayout).where(HjcPayout.race_id == race.id))
+        assert payout.raw["単勝払戻1"] == "350"
+
+    def test_seed_race_is_untouched_by_previous_test(self, race):
+        assert race.name == "大阪杯"
+        assert race.source == "KYI"
+        assert race.payout is None
+
+
+class TestIngestRaceOdds:
+    def test_bet_types_fill_one_row(self, db_session, race):
+        wide = pd.DataFrame([{
+            "race_key": race.race_key, "head_count": 4,
+            "odds": {"01-02": 5.5, "01-03": None},
+        }])
+        umatan = pd.DataFrame([{
+            "race_key": race.race_key, "head_count": None, "odds": {"02-01": 12.0},
+        }])
+        assert ingest_race_odds(db_session, wide, "wide") == 1
+        db_session.flush()
+        assert ingest_race_odds(db_session, umatan, "umatan") == 1
+        db_session.flush()
+
+        row = db_session.scalar(select(RaceOdds).where(RaceOdds.race_id == race.id))
+        assert row.wide == {"01-02": 5.5}
+        assert row.umatan == {"02-01": 12.0}
+        assert row.sanrenpuku is None
+        assert row.head_count == 4
+
+
+class TestIngestCyb:
+    def test_upserts_by_race_key_and_horse_number(self, db_session, race, sql_selects):
+        cyb = pd.DataFrame({
+            "場コード": [9, 9, 9], "年": [26] * 3, "回": [1] * 3, "日": [5] * 3, "R": [11] * 3,
+            "馬番": [1, 2, 9], "仕上指数": [55, 48, 60], "調教評価": ["A", "B", "C"],
+        })
+        assert ingest_cyb(db_session, cyb, HELD_ON) == 2  # 9番 is not in the race
+        db_session.flush()
+        cyb["仕上指数"] = [57, 48, 60]
+        sql_selects.clear()
+        assert ingest_cyb(db_session, cyb, HELD_ON) == 2
+        db_session.flush()
+
+        # Entries and existing records each come from one query, not one per row.
+        assert len(sql_selects) == 2
+        rows = db_session.scalars(
+            select(CybRecord).join(HorseEntry).where(HorseEntry.race_id == race.id)
+            .order_by(HorseEntry.horse_number)
+        ).all()
+        assert [(r.finish_index, r.training_eval) for r in rows] == [(57, "A"), (48, "B")]
@@ -0,0 +1,46 @@
+"""Tests for the lazily created production engine."""
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import src.db.session as db_session_module
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_import_does_not_create_engine():
+    # Fresh interpreter: other tests may already have imported src.db.
+    code = (
+        "from src.db import *; import src.db.session as s; "
+        "assert s._engine is None; "
+        "assert s.SessionLocal.kw.get('bind') is None"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=REPO_ROOT)
+
+
+def test_concurrent_first_calls_build_one_engine(monkeypatch):
+    monkeypatch.setattr(db_session_module, "_engine", None)
+    monkeypatch.setattr(db_session_module, "SessionLocal", db_session_module.sessionmaker())
+    start = threading.Barrier(8)
+    engines = []
+
+    def _first_call():
+        start.wait()
+        engines.append(db_session_module.get_engine())
+
+    def _slow_make_engine():
+        time.sleep(0.05)  # widen the window between the check and the assignment
+        return object()
+
+    with patch.object(db_session_module, "_make_engine", side_effect=_slow_make_engine) as make:
+        threads = [threading.Thread(target=_first_call) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert make.call_count == 1
+    assert len({id(e) for e in engines}) == 1
@@ -1,5 +1,6 @@
 """Tests for JRDB downloader with mock HTTP responses."""
 import io
+import struct
 import zipfile
 from unittest.mock import MagicMock, patch
 
@@ -7,7 +8,9 @@ import httpx
 import pytest
 
 from config.settings import Settings
-from src.download.jrdb import FILE_TYPES, JRDBDownloader
+from src.download.jrdb import FILE_TYPES, HTTP_LIMITS, JRDBDownloader, _make_client
+
+EXPECTED_FILE_TYPES = frozenset({"KYI", "SED", "HJC", "BAC", "OW", "OU", "OT", "CYB", "KKA"})
 
 
 @pytest.fixture
@@ -40,34 +43,55 @@ def _make_zip_bytes(filename: str, content: bytes) -> bytes:
     return buf.getvalue()
 
 
-class TestBuildURL:
-    def test_kyi_url(self, downloader):
-        url = downloader._build_url("KYI", "260405")
-        assert url == "http://www.jrdb.com/member/datazip/Kyi/2026/KYI260405.zip"
-
-    def test_sed_url(self, downloader):
-        url = downloader._build_url("SED", "260405")
-        assert url == "http://www.jrdb.com/member/datazip/Sed/2026/SED260405.zip"
-
-    def test_hjc_url(self, downloader):
-        url = downloader._build_url("HJC", "260405")
-        assert url == "https://jrdb.com/member/datazip/Hjc/2026/HJC260405.zip"
+def _crc16(data: bytes) -> int:
+    """CRC-16/ARC, the checksum LHA stores for each member."""
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def _make_lzh_bytes(filename: str, content: bytes) -> bytes:
+    """Create an LZH archive in memory with a single stored (-lh0-) file.
+
+    No archiver is needed: a level-0 header followed by the raw bytes and the
+    end-of-archive marker is a complete archive that lhafile can read.
+    """
+    name = filename.encode()
+    header = (
+        b"-lh0-"
+        + struct.pack("<IIIBB", len(content), len(content), 0, 0x20, 0)
+        + bytes([len(name)]) + name
+        + struct.pack("<H", _crc16(content))
+    )
+    return bytes([len(header), sum(header) & 0xFF]) + header + content + b"\x00"
 
-    def test_bac_url(self, downloader):
-        url = downloader._build_url("BAC", "260405")
-        assert url == "https://jrdb.com/member/data/Bac/BAC260405.lzh"
 
-    def test_kyi_url_no_year_subdir_fallback(self, downloader):
-        url = downloader._build_url("KYI", "260405", use_year_subdir=False)
-        assert url == "http://www.jrdb.com/member/datazip/Kyi/KYI260405.zip"
+class TestBuildURL:
+    @pytest.mark.parametrize(
+        ("file_type", "kwargs", "expected"),
+        [
+            ("KYI", {}, "http://www.jrdb.com/member/datazip/Kyi/2026/KYI260405.zip"),
+            ("SED", {}, "http://www.jrdb.com/member/datazip/Sed/2026/SED260405.zip"),
+            ("HJC", {}, "https://jrdb.com/member/datazip/Hjc/2026/HJC260405.zip"),
+            ("BAC", {}, "https://jrdb.com/member/data/Bac/BAC260405.lzh"),
+            (
+                "KYI",
+                {"use_year_subdir": False},
+                "http://www.jrdb.com/member/datazip/Kyi/KYI260405.zip",
+            ),
+        ],
+        ids=["kyi", "sed", "hjc", "bac", "kyi-no-year-subdir-fallback"],
+    )
+    def test_url(self, downloader, file_type, kwargs, expected):
+        assert downloader._build_url(file_type, "260405", **kwargs) == expected
 
 
 class TestFileTypes:
     def test_all_types_defined(self):
-        assert set(FILE_TYPES.keys()) == {
-            "KYI", "SED", "HJC", "BAC",
-            "OW", "OU", "OT", "CYB", "KKA",
-        }
+        assert FILE_TYPES.keys() == EXPECTED_FILE_TYPES
 
     def test_invalid_type(self, downloader):
         with pytest.raises(ValueError, match="Unknown file type"):
@@ -99,6 +123,24 @@ class TestDownloadFile:
         archive_path = tmp_output_dir / "KYI260405.zip"
         assert not archive_path.exists()
 
+    def test_download_and_extract_lzh(self, downloader, tmp_output_dir):
+        """BAC comes as LZH; it is extracted from memory like the ZIP types."""
+        sample_content = b"0926151120260405 test BAC data\r\n" * 20
+
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.content = _make_lzh_bytes("BAC260405.txt", sample_content)
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = MagicMock(spec=httpx.Client)
+        mock_client.get.return_value = mock_response
+
+        extracted = downloader.download_file("BAC", "260405", client=mock_client)
+
+        assert [p.name for p in extracted] == ["BAC260405.txt"]
+        assert extracted[0].read_bytes() == sample_content
+        assert not (tmp_output_dir / "BAC260405.lzh").exists()
+
     def test_download_uses_auth(self, downloader):
         """Test that HTTP Basic auth credentials are passed."""
         zip_bytes = _make_zip_bytes("KYI260405.txt", b"data")
@@ -192,3 +234,11 @@ class TestDownloadDateRange:
 
         assert results["260405"] == []
         assert len(results["260406"]) == 1
+
+
+class TestMakeClient:
+    def test_client_uses_keepalive_pool(self):
+        with patch.object(httpx, "Client") as client_cls:
+            _make_client()
+        assert client_cls.call_args.kwargs["limits"] is HTTP_LIMITS
+        assert HTTP_LIMITS.keepalive_expiry > 1.0  # outlives the default delay
@@ -1,10 +1,12 @@
 """Tests for feature engineering pipeline."""
 import numpy as np
 import pandas as pd
+import pytest
 
 from src.features.columns import LABEL_COLUMN
 from src.features.derived import add_derived_features
 from src.features.engineering import (
+    _parse_body_weight_delta,
     build_prediction_features,
     build_training_features,
     preprocess,
@@ -69,22 +71,26 @@ def _make_sed_df(n: int = 3) -> pd.DataFrame:
     })
 
 
-class TestBuildTrainingFeatures:
-    def test_basic(self):
-        kyi = _make_kyi_df()
-        sed = _make_sed_df()
-        result = build_training_features(kyi, sed)
+@pytest.fixture(scope="module")
+def training_features() -> pd.DataFrame:
+    """Labelled features for the 3-horse race of _make_kyi_df joined to _make_sed_df."""
+    return build_training_features(_make_kyi_df(), _make_sed_df())
 
-        assert LABEL_COLUMN in result.columns
-        assert len(result) == 3
 
-    def test_is_place_label(self):
-        kyi = _make_kyi_df()
-        sed = _make_sed_df()
-        result = build_training_features(kyi, sed)
+@pytest.fixture(scope="module")
+def prediction_features() -> pd.DataFrame:
+    """Unlabelled features for the same race, from the KYI frame alone."""
+    return build_prediction_features(_make_kyi_df())
 
+
+class TestBuildTrainingFeatures:
+    def test_basic(self, training_features):
+        assert LABEL_COLUMN in training_features.columns
+        assert len(training_features) == 3
+
+    def test_is_place_label(self, training_features):
         # 着順 1,3 → is_place=1; 着順 8 → is_place=0
-        assert result[LABEL_COLUMN].tolist() == [1, 1, 0]
+        assert training_features[LABEL_COLUMN].tolist() == [1, 1, 0]
 
     def test_anomaly_filter(self):
         kyi = _make_kyi_df()
@@ -94,53 +100,39 @@ class TestBuildTrainingFeatures:
         result = build_training_features(kyi, sed)
         assert len(result) == 2  # horse 3 filtered out
 
-    def test_feature_columns_present(self):
-        kyi = _make_kyi_df()
-        sed = _make_sed_df()
-        result = build_training_features(kyi, sed)
+    def test_feature_columns_present(self, training_features):
+        assert {"idm", "jockey_index", "odds", "pace_forecast"} <= set(training_features.columns)
 
-        for col in ["idm", "jockey_index", "odds", "pace_forecast"]:
-            assert col in result.columns
+    def test_weight_converted(self, training_features):
+        assert training_features["weight_carried"].iloc[0] == 55.0  # 550 / 10
 
-    def test_weight_converted(self):
-        kyi = _make_kyi_df()
-        sed = _make_sed_df()
-        result = build_training_features(kyi, sed)
-
-        assert result["weight_carried"].iloc[0] == 55.0  # 550 / 10
-
-    def test_derived_features(self):
-        kyi = _make_kyi_df()
-        sed = _make_sed_df()
-        result = build_training_features(kyi, sed)
-
-        assert "speed_balance" in result.columns
-        assert "position_delta" in result.columns
-        assert "log_odds" in result.columns
+    def test_derived_features(self, training_features):
+        assert {"speed_balance", "position_delta", "log_odds"} <= set(training_features.columns)
 
 
 class TestBuildPredictionFeatures:
-    def test_basic(self):
-        kyi = _make_kyi_df()
-        result = build_prediction_features(kyi)
+    def test_basic(self, prediction_features):
+        assert LABEL_COLUMN not in prediction_features.columns
+        assert len(prediction_features) == 3
 
-        assert LABEL_COLUMN not in result.columns
-        assert len(result) == 3
+    def test_has_metadata(self, prediction_features):
+        assert {"race_key", "horse_number", "horse_name"} <= set(prediction_features.columns)
 
-    def test_has_metadata(self):
-        kyi = _make_kyi_df()
-        result = build_prediction_features(kyi)
+    def test_has_features(self, prediction_features):
+        assert {"idm", "odds", "pace_forecast", "speed_balance"} <= set(prediction_features.columns)
 
-        assert "race_key" in result.columns
-        assert "horse_number" in result.columns
-        assert "horse_name" in result.columns
 
-    def test_has_features(self):
-        kyi = _make_kyi_df()
-        result = build_prediction_features(kyi)
+class TestParseBodyWeightDelta:
+    def test_signed_values_and_blanks(self):
+        df = pd.DataFrame({"枠確定馬体重増減": ["+05", "-08", "   ", None, "***", "+"]})
+        out = _parse_body_weight_delta(df)["body_weight_delta"]
+        assert out.iloc[0] == 5.0
+        assert out.iloc[1] == -8.0
+        assert out.iloc[2:].isna().all()
 
-        for col in ["idm", "odds", "pace_forecast", "speed_balance"]:
-            assert col in result.columns
+    def test_missing_column_is_noop(self):
+        df = pd.DataFrame({"x": [1]})
+        assert "body_weight_delta" not in _parse_body_weight_delta(df).columns
 
 
 class TestPreprocess:
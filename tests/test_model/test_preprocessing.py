@@ -6,14 +6,33 @@ AutoGluon is NOT imported - only preprocessing functions are tested.
 import numpy as np
 import pandas as pd
 
+from src.features.columns import CATEGORICAL_FEATURES as SRC_CATS
+from src.features.columns import FEATURE_COLUMNS
+from src.features.columns import NUMERICAL_DEFAULTS as SRC_DEFAULTS
 from src.model.functions import (
     CATEGORICAL_COLS,
     NUMERICAL_DEFAULTS,
     create_derived_features,
+    downcast_numeric,
     preprocess_features,
 )
 
 
+class TestDowncastNumeric:
+    def test_shrinks_floats_and_ints(self):
+        df = pd.DataFrame({"idm": [50.0, 61.5], "horse_number": [1, 16], "is_place": [0, 1]})
+        result = downcast_numeric(df, exclude=("is_place",))
+        assert result["idm"].dtype == np.float32
+        assert result["horse_number"].dtype == np.int8
+        assert result["is_place"].dtype == np.int64
+
+    def test_leaves_strings_alone(self):
+        df = pd.DataFrame({"running_style": ["1", "2"], "odds": [2.5, 10.0]})
+        result = downcast_numeric(df)
+        assert result["running_style"].tolist() == ["1", "2"]
+        assert result["odds"].dtype == np.float32
+
+
 class TestPreprocessFeatures:
     def test_fills_categorical_nan(self):
         df = pd.DataFrame({"pace_forecast": [None, "M", None]})
@@ -38,19 +57,12 @@ class TestPreprocessFeatures:
         Derived dynamically from src/features/columns.py so adding a feature
         there forces it to appear here too (no hardcoded list to update).
         """
-        from src.features.columns import (
-            CATEGORICAL_FEATURES,
-            FEATURE_COLUMNS,
-        )
-
-        expected_numeric = {c for c in FEATURE_COLUMNS if c not in CATEGORICAL_FEATURES}
+        expected_numeric = {c for c in FEATURE_COLUMNS if c not in SRC_CATS}
         missing = expected_numeric - set(NUMERICAL_DEFAULTS.keys())
         assert not missing, f"Missing defaults for: {sorted(missing)}"
 
     def test_categorical_cols_match(self):
         """Modal CATEGORICAL_COLS must match src/features/columns.py."""
-        from src.features.columns import CATEGORICAL_FEATURES as SRC_CATS
-
         assert CATEGORICAL_COLS == SRC_CATS
 
     def test_does_not_modify_original(self):
@@ -110,10 +122,8 @@ class TestPreprocessingSync:
 
     def test_defaults_match_src(self):
         """Modal NUMERICAL_DEFAULTS should match src/features/columns.py."""
-        from src.features.columns import NUMERICAL_DEFAULTS as SRC_DEFAULTS
         assert NUMERICAL_DEFAULTS == SRC_DEFAULTS
 
     def test_categorical_match_src(self):
         """Modal CATEGORICAL_COLS should match src/features/columns.py."""
-        from src.features.columns import CATEGORICAL_FEATURES as SRC_CATS
         assert CATEGORICAL_COLS == SRC_CATS
@@ -1,10 +1,10 @@
-"""Tests for parse_record, parse_file, and build_race_key."""
+"""Tests for parse_record, parse_file, build_race_key and build_race_keys."""
 import tempfile
 from pathlib import Path
 
 import pandas as pd
 
-from src.parser.engine import build_race_key, parse_file, parse_record
+from src.parser.engine import build_race_key, build_race_keys, parse_file, parse_record
 from src.parser.spec import FieldSpec
 
 
@@ -143,3 +143,20 @@ class TestBuildRaceKey:
     def test_numeric_day(self):
         record = {"場コード": 1, "年": 20, "回": 3, "日": 5, "R": 8}
         assert build_race_key(record) == "01203508"
+
+
+class TestBuildRaceKeys:
+    def test_matches_scalar_builder(self):
+        df = pd.DataFrame({
+            "場コード": [6, 5, 1, None],
+            "年": [26, 25, 20, 1],
+            "回": [2, 1, 3, 0],
+            "日": [10, 15, 5, 1],
+            "R": [11, 1, 8, 12.0],
+        })
+        expected = [build_race_key(r) for r in df.to_dict("records")]
+        assert build_race_keys(df).tolist() == expected
+
+    def test_empty_frame(self):
+        df = pd.DataFrame(columns=["場コード", "年", "回", "日", "R"])
+        assert build_race_keys(df).empty
@@ -1,4 +1,6 @@
 """Tests for HJC field definitions with spec-compliant binary fixtures."""
+import pytest
+
 from src.parser.engine import parse_record
 from src.parser.hjc import HJC_FIELDS, RECORD_LENGTH
 
@@ -58,45 +60,32 @@ class TestHJCFields:
     def test_record_length(self):
         assert RECORD_LENGTH == 444
 
-    def test_race_key(self):
-        record = parse_record(_make_hjc_record(), HJC_FIELDS)
-        assert record["場コード"] == 6
-        assert record["年"] == 26
-        assert record["R"] == 11
-
-    def test_win_payoff(self):
-        record = parse_record(_make_hjc_record(), HJC_FIELDS)
-        assert record["単勝馬番_1"] == 3
-        assert record["単勝払戻_1"] == 1250
-        assert record["単勝馬番_2"] == 0
-        assert record["単勝払戻_2"] == 0
-
-    def test_place_payoff(self):
-        record = parse_record(_make_hjc_record(), HJC_FIELDS)
-        assert record["複勝馬番_1"] == 3
-        assert record["複勝払戻_1"] == 350
-        assert record["複勝馬番_2"] == 7
-        assert record["複勝払戻_2"] == 420
-        assert record["複勝馬番_3"] == 12
-        assert record["複勝払戻_3"] == 680
-
-    def test_quinella_payoff(self):
-        record = parse_record(_make_hjc_record(), HJC_FIELDS)
-        assert record["馬連組合せ_1"] == "0307"
-        assert record["馬連払戻_1"] == 3250
-
-    def test_trifecta_payoff(self):
-        record = parse_record(_make_hjc_record(), HJC_FIELDS)
-        assert record["三連複組合せ_1"] == "030712"
-        assert record["三連複払戻_1"] == 15820
-
-    def test_trio_payoff(self):
-        record = parse_record(_make_hjc_record(), HJC_FIELDS)
-        assert record["三連単組合せ_1"] == "030712"
-        assert record["三連単払戻_1"] == 85430
-
-    def test_empty_slots(self):
-        """Empty payoff slots should return None or 0."""
-        record = parse_record(_make_hjc_record(), HJC_FIELDS)
-        # 単勝馬番_3 is empty (spaces)
-        assert record["単勝馬番_3"] is None
+
+# (field, expected) for the default record built by _make_hjc_record.
+_EXPECTED_FIELDS = [
+    # race key
+    ("場コード", 6), ("年", 26), ("R", 11),
+    # 単勝
+    ("単勝馬番_1", 3), ("単勝払戻_1", 1250), ("単勝馬番_2", 0), ("単勝払戻_2", 0),
+    # 複勝
+    ("複勝馬番_1", 3), ("複勝払戻_1", 350), ("複勝馬番_2", 7), ("複勝払戻_2", 420),
+    ("複勝馬番_3", 12), ("複勝払戻_3", 680),
+    # 馬連 / 三連複 / 三連単
+    ("馬連組合せ_1", "0307"), ("馬連払戻_1", 3250),
+    ("三連複組合せ_1", "030712"), ("三連複払戻_1", 15820),
+    ("三連単組合せ_1", "030712"), ("三連単払戻_1", 85430),
+    # Empty payoff slots (spaces) parse to None.
+    ("単勝馬番_3", None),
+]
+
+
+@pytest.fixture(scope="module")
+def hjc_record() -> dict:
+    """中山11R payoffs (単勝 3番 1250円, 複勝 3番/7番, ...), parsed with HJC_FIELDS."""
+    return parse_record(_make_hjc_record(), HJC_FIELDS)
+
+
+class TestHJCRecord:
+    @pytest.mark.parametrize(("field", "expected"), _EXPECTED_FIELDS)
+    def test_field(self, hjc_record, field, expected):
+        assert hjc_record[field] == expected
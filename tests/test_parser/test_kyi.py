@@ -1,4 +1,6 @@
 """Tests for KYI field definitions with spec-compliant binary fixtures."""
+import pytest
+
 from src.parser.engine import parse_record
 from src.parser.kyi import KYI_FIELDS, RECORD_LENGTH
 
@@ -75,73 +77,43 @@ class TestKYIFields:
     def test_record_length(self):
         assert RECORD_LENGTH == 1024
 
-    def test_race_key(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["場コード"] == 6
-        assert record["年"] == 26
-        assert record["回"] == 2
-        assert record["日"] == 10  # hex 'a' = 10
-        assert record["R"] == 11
-
-    def test_horse_info(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["馬番"] == 3
-        assert record["血統登録番号"] == "20190001"
-        assert record["馬名"] == "テスト馬名"
-
-    def test_indices(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["IDM"] == 52.3
-        assert record["騎手指数"] == 48.5
-        assert record["情報指数"] == 45.0
-        assert record["総合指数"] == 60.1
-        assert record["調教指数"] == 55.0
-        assert record["厩舎指数"] == 47.3
-
-    def test_attributes(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["脚質"] == 1
-        assert record["距離適性"] == 3
-        assert record["重適正コード"] == 2
-
-    def test_odds(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["基準オッズ"] == 5.2
-        assert record["基準人気順位"] == 2
-
-    def test_tenkai_data(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["テン指数"] == 48.5
-        assert record["ペース指数"] == 50.2
-        assert record["上がり指数"] == 53.1
-        assert record["位置指数"] == 46.8
-        assert record["ペース予想"] == "M"
-        assert record["道中順位"] == 3
-        assert record["道中差"] == 2
-        assert record["道中内外"] == 3
-        assert record["後3F順位"] == 2
-        assert record["後3F差"] == 1
-        assert record["後3F内外"] == 2
-        assert record["ゴール順位"] == 1
-        assert record["ゴール差"] == 0
-        assert record["ゴール内外"] == 2
-        assert record["展開記号"] == "A"
-
-    def test_risk_data(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["馬スタート指数"] == 5.2
-        assert record["馬出遅率"] == 3.5
-        assert record["万券指数"] == 45
-
-    def test_cancel_flag(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["取消フラグ"] == 0
-
-    def test_sex_code(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["性別コード"] == 1  # 牡
-
-    def test_weight(self):
-        record = parse_record(_make_full_kyi_record(), KYI_FIELDS)
-        assert record["負担重量"] == 550  # 55.0kg in 0.1kg units
-        assert record["枠番"] == 3
+
+# (field, expected) for the default record built by _make_full_kyi_record.
+_EXPECTED_FIELDS = [
+    # race key
+    ("場コード", 6), ("年", 26), ("回", 2),
+    ("日", 10),  # hex 'a' = 10
+    ("R", 11),
+    # horse info
+    ("馬番", 3), ("血統登録番号", "20190001"), ("馬名", "テスト馬名"),
+    # indices
+    ("IDM", 52.3), ("騎手指数", 48.5), ("情報指数", 45.0), ("総合指数", 60.1),
+    ("調教指数", 55.0), ("厩舎指数", 47.3),
+    # attributes
+    ("脚質", 1), ("距離適性", 3), ("重適正コード", 2),
+    # odds
+    ("基準オッズ", 5.2), ("基準人気順位", 2),
+    # tenkai data
+    ("テン指数", 48.5), ("ペース指数", 50.2), ("上がり指数", 53.1), ("位置指数", 46.8),
+    ("ペース予想", "M"), ("道中順位", 3), ("道中差", 2), ("道中内外", 3),
+    ("後3F順位", 2), ("後3F差", 1), ("後3F内外", 2),
+    ("ゴール順位", 1), ("ゴール差", 0), ("ゴール内外", 2), ("展開記号", "A"),
+    # risk data
+    ("馬スタート指数", 5.2), ("馬出遅率", 3.5), ("万券指数", 45),
+    ("取消フラグ", 0),
+    ("性別コード", 1),  # 牡
+    ("負担重量", 550),  # 55.0kg in 0.1kg units
+    ("枠番", 3),
+]
+
+
+@pytest.fixture(scope="module")
+def kyi_record() -> dict:
+    """中山 2回a日 11R 馬番3 テスト馬名, parsed with KYI_FIELDS for every field case."""
+    return parse_record(_make_full_kyi_record(), KYI_FIELDS)
+
+
+class TestKYIRecord:
+    @pytest.mark.parametrize(("field", "expected"), _EXPECTED_FIELDS)
+    def test_field(self, kyi_record, field, expected):
+        assert kyi_record[field] == expected
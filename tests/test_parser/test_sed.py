@@ -1,6 +1,8 @@
 """Tests for SED field definitions with spec-compliant binary fixtures."""
+import pytest
+
 from src.parser.engine import parse_record
-from src.parser.sed import RECORD_LENGTH, SED_FIELDS
+from src.parser.sed import RECORD_LENGTH, SED_FIELDS, SED_LABEL_FIELDS
 
 
 def _make_sed_record(**overrides: tuple[int, str]) -> bytes:
@@ -61,58 +63,46 @@ class TestSEDFields:
     def test_record_length(self):
         assert RECORD_LENGTH == 376
 
-    def test_race_key(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["場コード"] == 6
-        assert record["年"] == 26
-        assert record["R"] == 11
-
-    def test_race_conditions(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["距離"] == 2000
-        assert record["芝ダ障害コード"] == 1  # 芝
-        assert record["グレード"] == 1  # G1
-        assert record["頭数"] == 16
-
-    def test_result(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
+
+# (field, expected) for the default record built by _make_sed_record.
+_EXPECTED_FIELDS = [
+    # race key
+    ("場コード", 6), ("年", 26), ("R", 11),
+    # race conditions
+    ("距離", 2000),
+    ("芝ダ障害コード", 1),  # 芝
+    ("グレード", 1),  # G1
+    ("頭数", 16),
+    # result
+    ("着順", 1), ("異常区分", 0), ("タイム", 2001),
+    ("確定単勝オッズ", 5.2),
+    # speed indices / pace / timing
+    ("テン指数", 48.5), ("上がり指数", 53.1), ("ペース指数", 50.2),
+    ("レースペース", "M"), ("馬ペース", "M"),
+    ("前3Fタイム", 351), ("後3Fタイム", 334),
+    # corner positions
+    ("コーナー順位1", 5), ("コーナー順位2", 4), ("コーナー順位3", 3), ("コーナー順位4", 2),
+    # weight
+    ("馬体重", 480), ("馬体重増減", "+04"),
+    # running style
+    ("レース脚質", "2"),  # text type
+    ("4角コース取り", 3),
+]
+
+
+@pytest.fixture(scope="module")
+def sed_record() -> dict:
+    """The 中山11R 馬番3 result row (2000m 芝 G1), parsed with the full SED_FIELDS."""
+    return parse_record(_make_sed_record(), SED_FIELDS)
+
+
+class TestSEDRecord:
+    @pytest.mark.parametrize(("field", "expected"), _EXPECTED_FIELDS)
+    def test_field(self, sed_record, field, expected):
+        assert sed_record[field] == expected
+
+    def test_label_fields_subset(self, sed_record):
+        record = parse_record(_make_sed_record(), SED_LABEL_FIELDS)
+        assert len(record) == 8
+        assert record == {k: sed_record[k] for k in record}
         assert record["着順"] == 1
-        assert record["異常区分"] == 0
-        assert record["タイム"] == 2001
-
-    def test_odds(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["確定単勝オッズ"] == 5.2
-
-    def test_speed_indices(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["テン指数"] == 48.5
-        assert record["上がり指数"] == 53.1
-        assert record["ペース指数"] == 50.2
-
-    def test_pace(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["レースペース"] == "M"
-        assert record["馬ペース"] == "M"
-
-    def test_timing(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["前3Fタイム"] == 351
-        assert record["後3Fタイム"] == 334
-
-    def test_corner_positions(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["コーナー順位1"] == 5
-        assert record["コーナー順位2"] == 4
-        assert record["コーナー順位3"] == 3
-        assert record["コーナー順位4"] == 2
-
-    def test_weight(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["馬体重"] == 480
-        assert record["馬体重増減"] == "+04"
-
-    def test_running_style(self):
-        record = parse_record(_make_sed_record(), SED_FIELDS)
-        assert record["レース脚質"] == "2"  # text type
-        assert record["4角コース取り"] == 3
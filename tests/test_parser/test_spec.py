@@ -1,50 +1,36 @@
 """Tests for FieldSpec and coerce function."""
-from src.parser.spec import FieldSpec, coerce
-
-
-class TestCoerce:
-    def test_numeric_normal(self):
-        assert coerce("123", "numeric") == 123
-
-    def test_numeric_zero(self):
-        assert coerce("0", "numeric") == 0
-
-    def test_numeric_empty(self):
-        assert coerce("", "numeric") is None
-
-    def test_numeric_spaces(self):
-        assert coerce("", "numeric") is None
-
-    def test_numeric_with_minus(self):
-        assert coerce("-5", "numeric", signed=True) == -5
+import pytest
 
-    def test_text_normal(self):
-        assert coerce("ディープインパクト", "text") == "ディープインパクト"
-
-    def test_text_empty(self):
-        assert coerce("", "text") is None
-
-    def test_decimal_normal(self):
-        assert coerce("12.3", "decimal", scale=1) == 12.3
-
-    def test_decimal_integer_form(self):
-        """ZZ9.9 format without decimal point is parsed as float."""
-        assert coerce("123", "decimal", scale=1) == 123.0
-
-    def test_decimal_empty(self):
-        assert coerce("", "decimal", scale=1) is None
-
-    def test_hex_normal(self):
-        assert coerce("a", "hex") == 10
+from src.parser.spec import FieldSpec, coerce
 
-    def test_hex_digit(self):
-        assert coerce("5", "hex") == 5
+# (raw, field_type, extra coerce kwargs, expected)
+_COERCE_CASES = [
+    pytest.param("123", "numeric", {}, 123, id="numeric-normal"),
+    pytest.param("0", "numeric", {}, 0, id="numeric-zero"),
+    pytest.param("", "numeric", {}, None, id="numeric-empty"),
+    pytest.param("   ", "numeric", {}, None, id="numeric-spaces"),
+    pytest.param("-5", "numeric", {"signed": True}, -5, id="numeric-with-minus"),
+    pytest.param("ディープインパクト", "text", {}, "ディープインパクト", id="text-normal"),
+    pytest.param("", "text", {}, None, id="text-empty"),
+    pytest.param("12.3", "decimal", {"scale": 1}, 12.3, id="decimal-normal"),
+    # ZZ9.9 format without decimal point is parsed as float.
+    pytest.param("123", "decimal", {"scale": 1}, 123.0, id="decimal-integer-form"),
+    pytest.param("", "decimal", {"scale": 1}, None, id="decimal-empty"),
+    pytest.param("a", "hex", {}, 10, id="hex-normal"),
+    pytest.param("5", "hex", {}, 5, id="hex-digit"),
+    pytest.param("", "hex", {}, None, id="hex-empty"),
+    pytest.param("f", "hex", {}, 15, id="hex-f"),
+]
 
-    def test_hex_empty(self):
-        assert coerce("", "hex") is None
 
-    def test_hex_f(self):
-        assert coerce("f", "hex") == 15
+class TestCoerce:
+    @pytest.mark.parametrize(("raw", "field_type", "kwargs", "expected"), _COERCE_CASES)
+    def test_coerce(self, raw, field_type, kwargs, expected):
+        result = coerce(raw, field_type, **kwargs)
+        if expected is None:
+            assert result is None
+        else:
+            assert result == expected
 
 
 class TestFieldSpec:
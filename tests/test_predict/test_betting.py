@@ -1,5 +1,6 @@
 """Tests for EV-based betting recommendations."""
 import pandas as pd
+import pytest
 
 from src.predict.betting import (
     compute_expected_values,
@@ -17,11 +18,14 @@ def _race_df() -> pd.DataFrame:
     })
 
 
-class TestComputeExpectedValues:
-    def test_ev_math(self):
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
+@pytest.fixture(scope="module")
+def ev() -> pd.DataFrame:
+    """ev_tan/ev_fuku for the four _race_df horses at is_place [0.6, 0.3, 0.2, 0.05]."""
+    return compute_expected_values(_race_df(), [0.6, 0.3, 0.2, 0.05])
+
 
+class TestComputeExpectedValues:
+    def test_ev_math(self, ev):
         # ev_tan = (is_place / 3) * odds
         # horse 1: 0.2*2.0=0.4, horse 2: 0.1*5.0=0.5, horse 3: 0.0667*10=0.667, horse 4: 0.0167*20=0.333
         assert list(ev["horse_number"]) == [3, 2, 1, 4]
@@ -38,10 +42,8 @@ class TestComputeExpectedValues:
 
 
 class TestRecommendBets:
-    def test_tansho_threshold(self):
+    def test_tansho_threshold(self, ev):
         # ev_tan: h1=0.4, h2=0.5, h3=0.667, h4=0.333 → none > 1.0
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
         bets = recommend_bets(ev, ev_threshold=1.0)
         assert bets["tansho"] == []
 
@@ -49,10 +51,8 @@ class TestRecommendBets:
         # > 0.4: h3(0.667), h2(0.5) → horses 3, 2
         assert sorted(bets_lo["tansho"]) == [2, 3]
 
-    def test_fukusho_picks(self):
+    def test_fukusho_picks(self, ev):
         # ev_fuku: 0.72, 0.6, 0.6, 0.3 — none over 1.0
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
         bets = recommend_bets(ev, ev_threshold=1.0)
         assert bets["fukusho"] == []
 
@@ -60,16 +60,12 @@ class TestRecommendBets:
         bets_lo = recommend_bets(ev, ev_threshold=0.5)
         assert 1 in bets_lo["fukusho"]
 
-    def test_umaren_box_pairs(self):
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
+    def test_umaren_box_pairs(self, ev):
         bets = recommend_bets(ev, box_size=3)
         # Top 3 by ev_tan: horses 3, 2, 1 → sorted combos: (1,2), (1,3), (2,3)
         assert bets["umaren_box"] == [(1, 2), (1, 3), (2, 3)]
 
-    def test_sanrenpuku_box(self):
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
+    def test_sanrenpuku_box(self, ev):
         bets = recommend_bets(ev, trifecta_box_size=4)
         # Top 4 → C(4,3) = 4 combos
         assert len(bets["sanrenpuku_box"]) == 4
@@ -84,12 +80,10 @@ class TestRecommendBets:
 
 
 class TestRecommendNagashi:
-    def test_axis_and_partners(self):
+    def test_axis_and_partners(self, ev):
         # ev_fuku: h1=0.6*1.2=0.72, h2=0.3*2=0.6, h3=0.2*3=0.6, h4=0.05*6=0.3
         # ev_tan:  h1=0.4, h2=0.5, h3=0.667, h4=0.333
         # axis_criteria=ev_fuku threshold=0.5 → top: h1(0.72) clears
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
         result = recommend_nagashi(
             ev,
             axis_criteria="ev_fuku",
@@ -103,16 +97,12 @@ class TestRecommendNagashi:
         # Combos: axis=1 + every pair from partners → C(3,2)=3
         assert sorted(result["combos"]) == [(1, 2, 3), (1, 2, 4), (1, 3, 4)]
 
-    def test_no_axis_returns_none(self):
+    def test_no_axis_returns_none(self, ev):
         # All ev_fuku < 1.0 → no axis qualifies
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
         result = recommend_nagashi(ev, axis_criteria="ev_fuku", axis_threshold=1.0)
         assert result == {"axis": None, "partners": [], "combos": []}
 
-    def test_max_partners_cap(self):
-        preds = [0.6, 0.3, 0.2, 0.05]
-        ev = compute_expected_values(_race_df(), preds)
+    def test_max_partners_cap(self, ev):
         result = recommend_nagashi(
             ev,
             axis_criteria="ev_fuku",
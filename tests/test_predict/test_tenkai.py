@@ -1,7 +1,11 @@
 """Tests for 展開予想 formatter."""
 import pandas as pd
 
-from src.predict.tenkai import format_tenkai
+from src.predict.tenkai import _IO_LUT, _STYLE_LUT, _code_labels, format_tenkai
+
+# is_place probabilities and 複勝 odds in _make_race_df row order.
+_PREDICTIONS: tuple[float, ...] = (0.78, 0.65, 0.58, 0.25)
+_FUKUSHO_ODDS: tuple[float, ...] = (1.5, 2.0, 1.4, 8.0)
 
 
 def _make_race_df() -> pd.DataFrame:
@@ -52,6 +56,14 @@ class TestFormatTenkai:
         assert "逃げ馬" in output
         assert "3番" in output
 
+    def test_front_runners_from_string_codes(self):
+        df = _make_race_df()
+        df["running_style"] = ["1.0", "2.0", "3.0", "Unknown"]
+        output = format_tenkai(df)
+
+        assert "逃げ馬: 3番" in output
+        assert "先行争い" in output
+
     def test_position_table(self):
         df = _make_race_df()
         output = format_tenkai(df)
@@ -61,8 +73,7 @@ class TestFormatTenkai:
 
     def test_with_predictions(self):
         df = _make_race_df()
-        predictions = [0.78, 0.65, 0.58, 0.25]
-        output = format_tenkai(df, predictions)
+        output = format_tenkai(df, list(_PREDICTIONS))
 
         assert "ML予測" in output
         assert "78.0%" in output
@@ -105,17 +116,15 @@ class TestFormatTenkai:
 
     def test_bets_section_with_predictions(self):
         df = _make_race_df()
-        df["fukusho_odds"] = [1.5, 2.0, 1.4, 8.0]
-        predictions = [0.78, 0.65, 0.58, 0.25]
-        output = format_tenkai(df, predictions)
+        df["fukusho_odds"] = _FUKUSHO_ODDS
+        output = format_tenkai(df, list(_PREDICTIONS))
 
         assert "期待値ランキング" in output
         assert "買い目" in output
 
     def test_no_bets_when_disabled(self):
         df = _make_race_df()
-        predictions = [0.78, 0.65, 0.58, 0.25]
-        output = format_tenkai(df, predictions, show_bets=False)
+        output = format_tenkai(df, list(_PREDICTIONS), show_bets=False)
 
         assert "期待値ランキング" not in output
         assert "買い目" not in output
@@ -124,9 +133,8 @@ class TestFormatTenkai:
         df = _make_race_df()
         # Force ev_fuku for horse 3 to clear threshold:
         # ev_fuku = prob * fukusho_odds → 0.78 * 1.5 = 1.17 > 1.0
-        df["fukusho_odds"] = [1.5, 2.0, 1.4, 8.0]
-        predictions = [0.78, 0.65, 0.58, 0.25]
-        output = format_tenkai(df, predictions, ev_threshold=1.0)
+        df["fukusho_odds"] = _FUKUSHO_ODDS
+        output = format_tenkai(df, list(_PREDICTIONS), ev_threshold=1.0)
 
         assert "3連複軸1頭流し" in output
         assert "見送り" not in output
@@ -140,3 +148,14 @@ class TestFormatTenkai:
 
         assert "3連複軸1頭流し" in output
         assert "見送り" in output
+
+
+class TestCodeLabels:
+    def test_matches_dict_lookup(self):
+        df = pd.DataFrame({"running_style": ["1", 2.0, None, 9, -1, "x"]})
+        labels = _code_labels(df, "running_style", _STYLE_LUT, "自在")
+        assert list(labels) == ["逃げ", "先行", "自在", "自在", "自在", "自在"]
+
+    def test_missing_column_uses_default(self):
+        df = pd.DataFrame({"horse_number": [1, 2]})
+        assert list(_code_labels(df, "goal_io", _IO_LUT, "-")) == ["-", "-"]